@@ -12,12 +12,15 @@ import logging
 import time
 import weave
 from typing import Dict, List, Optional, Tuple, Any
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime, timedelta
 from pathlib import Path
 import hashlib
 import pickle
 import os
+import sys
 
 from google.adk import Agent, Runner
 from google.adk.tools import FunctionTool
@@ -70,6 +73,11 @@ class AnalysisResult:
     context_summary: str
     application_detected: str
     detailed_analysis: Dict[str, Any]
+    
+    @cached_property
+    def confidence_pct(self) -> str:
+        """Confidence formatted as a percentage, computed once per result"""
+        return f"{self.confidence:.1%}"
 
 @dataclass
 class ApplicationContext:
@@ -80,6 +88,9 @@ class ApplicationContext:
     confidence: float
     context_clues: List[str]
 
+# Screenshot digests remembered per (path, mtime, size), so get/set hash a frame once
+SCREENSHOT_DIGEST_CACHE_SIZE = 64
+
 class AnalysisCache:
     """High-performance cache for analysis results"""
     
@@ -87,11 +98,38 @@ class AnalysisCache:
         self.cache_dir = Path(cache_dir)
         self.max_age_minutes = max_age_minutes
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._screenshot_digests: OrderedDict = OrderedDict()
+    
+    def _screenshot_digest(self, screenshot_path: Optional[str]) -> str:
+        """Content digest of a screenshot, so identical frames share cache entries"""
+        if not screenshot_path:
+            return ''
+        try:
+            stat = os.stat(screenshot_path)
+        except OSError:
+            return screenshot_path
+        
+        file_key = (screenshot_path, stat.st_mtime_ns, stat.st_size)
+        digest = self._screenshot_digests.get(file_key)
+        if digest is not None:
+            self._screenshot_digests.move_to_end(file_key)
+            return digest
+        
+        try:
+            with open(screenshot_path, 'rb') as f:
+                digest = hashlib.md5(f.read()).hexdigest()
+        except OSError:
+            return screenshot_path
+        
+        self._screenshot_digests[file_key] = digest
+        if len(self._screenshot_digests) > SCREENSHOT_DIGEST_CACHE_SIZE:
+            self._screenshot_digests.popitem(last=False)
+        return digest
     
     @weave.op()
     def _get_cache_key(self, input_text: str, screenshot_path: Optional[str]) -> str:
         """Generate MD5 cache key from input"""
-        content = f"{input_text}:{screenshot_path or ''}"
+        content = f"{input_text}:{self._screenshot_digest(screenshot_path)}"
         return hashlib.md5(content.encode()).hexdigest()
     
     @weave.op()
@@ -366,22 +404,30 @@ Respond with JSON format:
             log_timing("GEMINI_ANALYSIS_START", timestamp_gemini_start, input_text)
             
             if screenshot_path and os.path.exists(screenshot_path):
-                analysis_data = await self._analyze_multimodal_content(input_text, screenshot_path)
+                content_analysis = self._analyze_multimodal_content(input_text, screenshot_path)
             else:
-                analysis_data = await self._analyze_text_content(input_text)
+                content_analysis = self._analyze_text_content(input_text)
+            
+            # Application detection is independent of the content analysis, so overlap them
+            analysis_data, app_context = await asyncio.gather(
+                content_analysis,
+                self._detect_application_context(screenshot_path)
+            )
             
             timestamp_gemini_end = get_precise_timestamp()
             log_timing("GEMINI_ANALYSIS_END", timestamp_gemini_end, input_text, f"gemini_time={(timestamp_gemini_end-timestamp_gemini_start):.2f}s")
             
-            # Detect application context
-            app_context = await self._detect_application_context(screenshot_path)
+            # A handful of distinct categories; intern them so results share one string
+            category = analysis_data.get('category') or 'unknown'
+            if isinstance(category, str):
+                category = sys.intern(category)
             
             # Create structured result
             result = AnalysisResult(
                 timestamp=datetime.now(),
                 input_text=input_text,
                 screenshot_path=screenshot_path,
-                category=analysis_data.get('category', 'unknown'),
+                category=category,
                 confidence=analysis_data.get('confidence', 0.0),
                 age_appropriateness=analysis_data.get('age_appropriateness', {}),
                 safety_concerns=analysis_data.get('safety_concerns', []),
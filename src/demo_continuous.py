@@ -147,7 +147,7 @@ async def demo_continuous_monitoring():
     # Show recent events
     if hasattr(agent, 'event_history') and agent.event_history:
         print(f"\n📋 Recent Events:")
-        for i, event in enumerate(agent.event_history[-5:], 1):
+        for i, event in enumerate(list(agent.event_history)[-5:], 1):
             if hasattr(event, 'analysis_result') and event.analysis_result:
                 category = event.analysis_result.category
                 action = event.judgment_result.action.value if event.judgment_result else "unknown"
@@ -1,9 +1,10 @@
 import asyncio
 import base64
 import json
+import logging
 import os
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -15,9 +16,82 @@ from google.adk.sessions import InMemorySessionService
 from google.adk.runners import Runner
 from dotenv import load_dotenv
 
+try:
+    from google.generativeai import caching as genai_caching
+except ImportError:
+    genai_caching = None
+
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+def _few_shot_turn(text_input: str, assessment: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """One worked example as a user/model exchange in the analysis prompt format"""
+    return [
+        {"role": "user", "parts": [f'CONTENT PROVIDED: text\n\nTEXT INPUT: "{text_input}"']},
+        {"role": "model", "parts": [json.dumps(assessment, indent=2)]},
+    ]
+
+_SAFE_FLAGS = {"violence": False, "adult_content": False, "inappropriate_language": False, "dangerous_activities": False}
+
+# Worked examples cached with the system instruction. Together they clear the
+# model's minimum cacheable size, which the instruction alone does not.
+FEW_SHOT_EXAMPLES: List[Dict[str, Any]] = [
+    *_few_shot_turn("how do plants make food from sunlight", {
+        "category": "educational",
+        "confidence": 0.96,
+        "age_appropriate": {"elementary": True, "middle_school": True, "high_school": True},
+        "concerns": [],
+        "educational_value": "Science question about photosynthesis",
+        "recommendations": ["Encourage follow-up reading on plant biology"],
+        "context_summary": "The child is researching how photosynthesis works",
+        "detected_elements": ["science", "plants", "photosynthesis"],
+        "safety_assessment": _SAFE_FLAGS,
+        "parental_action": "allow",
+        "explanation": "A standard school science topic with no safety concerns"
+    }),
+    *_few_shot_turn("minecraft survival let's play episode 12", {
+        "category": "entertainment",
+        "confidence": 0.9,
+        "age_appropriate": {"elementary": True, "middle_school": True, "high_school": True},
+        "concerns": ["Screen time"],
+        "educational_value": "Limited; some creativity and problem solving",
+        "recommendations": ["Keep an eye on total screen time"],
+        "context_summary": "The child is looking for a Minecraft gameplay video",
+        "detected_elements": ["video game", "gameplay video"],
+        "safety_assessment": _SAFE_FLAGS,
+        "parental_action": "allow",
+        "explanation": "Popular age-appropriate game content"
+    }),
+    *_few_shot_turn("someone in the game chat asked for my home address and school", {
+        "category": "concerning",
+        "confidence": 0.88,
+        "age_appropriate": {"elementary": False, "middle_school": False, "high_school": False},
+        "concerns": ["Stranger requesting personal information", "Possible grooming"],
+        "educational_value": None,
+        "recommendations": ["Talk with the child about not sharing personal details", "Review the game's chat settings"],
+        "context_summary": "An online contact asked the child for identifying information",
+        "detected_elements": ["online chat", "personal information request"],
+        "safety_assessment": _SAFE_FLAGS,
+        "parental_action": "restrict",
+        "explanation": "Requests for a child's address or school from strangers are a safety risk"
+    }),
+    *_few_shot_turn("how to make a bomb at home", {
+        "category": "dangerous",
+        "confidence": 0.97,
+        "age_appropriate": {"elementary": False, "middle_school": False, "high_school": False},
+        "concerns": ["Instructions for weapons or explosives"],
+        "educational_value": None,
+        "recommendations": ["Block the content", "Discuss the search with the child"],
+        "context_summary": "The child is searching for instructions to build an explosive",
+        "detected_elements": ["explosives", "weapon instructions"],
+        "safety_assessment": {**_SAFE_FLAGS, "violence": True, "dangerous_activities": True},
+        "parental_action": "block",
+        "explanation": "Content about making explosives is dangerous at any age"
+    }),
+]
+
 class ContentCategory(Enum):
     """Content categories for parental control assessment"""
     SAFE = "safe"
@@ -66,6 +140,11 @@ class MultimodalAnalysisConfig:
     # Performance settings
     max_response_tokens: int = 1000
     temperature: float = 0.1  # Low temperature for consistent results
+    
+    # Explicit context caching of the static analysis instructions
+    # gemini-2.5-flash caches from 1,024 tokens; gemini-1.5 models need 32,768
+    context_cache_model: str = 'models/gemini-2.5-flash'
+    context_cache_ttl_seconds: int = 3600
 
 class GeminiMultimodalAnalyzer:
     """Gemini multimodal content analyzer for parental control"""
@@ -84,8 +163,12 @@ class GeminiMultimodalAnalyzer:
         # Analysis history for context
         self.analysis_history = []
         
-    def _create_analysis_prompt(self, text_input: str, has_image: bool = False) -> str:
-        """Create a comprehensive analysis prompt for parental control"""
+        # Server-side cache of the static instructions (see enable_context_cache)
+        self._cached_content = None
+        self._cached_model = None
+        
+    def _create_system_instruction(self) -> str:
+        """Create the static part of the analysis prompt (depends only on config)"""
         
         age_group_desc = {
             AgeGroup.ELEMENTARY: "elementary school children (ages 6-12)",
@@ -95,9 +178,9 @@ class GeminiMultimodalAnalyzer:
         
         target_age = age_group_desc[self.config.target_age_group]
         
-        prompt = f"""
+        instruction = f"""
 You are an expert AI assistant specializing in parental control and child safety assessment. 
-Analyze the provided content (text{' and image' if has_image else ''}) for appropriateness for {target_age}.
+Analyze the provided content (text, and an image when one is attached) for appropriateness for {target_age}.
 
 ANALYSIS REQUIREMENTS:
 1. Content Category Assessment:
@@ -119,8 +202,6 @@ ANALYSIS REQUIREMENTS:
    - Identify key elements in the content
    - Understand the overall context
 
-TEXT INPUT: "{text_input}"
-
 RESPOND IN VALID JSON FORMAT ONLY:
 {{
   "category": "safe|educational|entertainment|social|concerning|inappropriate|dangerous",
@@ -147,7 +228,69 @@ RESPOND IN VALID JSON FORMAT ONLY:
 
 IMPORTANT: Return ONLY the JSON object, no additional text.
 """
-        return prompt.strip()
+        return instruction.strip()
+    
+    def _create_analysis_prompt(self, text_input: str, has_image: bool = False) -> str:
+        """Create a comprehensive analysis prompt for parental control"""
+        content_prompt = f"""
+CONTENT PROVIDED: text{' and image' if has_image else ''}
+
+TEXT INPUT: "{text_input}"
+"""
+        if self._cached_model is not None:
+            # Static instructions are already held in the cached context
+            return content_prompt.strip()
+        return f"{self._create_system_instruction()}\n{content_prompt}".strip()
+    
+    def _generation_model(self):
+        """Model to generate with: the cached-context model when available"""
+        return self._cached_model if self._cached_model is not None else self.model
+    
+    def enable_context_cache(self) -> bool:
+        """Upload the static instructions and worked examples as cached content and generate from it"""
+        if genai_caching is None:
+            return False
+        if self._cached_content is not None:
+            return True
+        try:
+            cached_content = genai_caching.CachedContent.create(
+                model=self.config.context_cache_model,
+                display_name="parental-control-analysis",
+                system_instruction=self._create_system_instruction(),
+                contents=FEW_SHOT_EXAMPLES,
+                ttl=timedelta(seconds=self.config.context_cache_ttl_seconds),
+            )
+            self._cached_model = genai.GenerativeModel.from_cached_content(cached_content=cached_content)
+            self._cached_content = cached_content
+            return True
+        except Exception as e:
+            # e.g. prompt below the minimum cacheable size, or model without caching support
+            logger.warning(f"Gemini context cache creation failed, sending full prompts: {e}")
+            self._cached_content = None
+            self._cached_model = None
+            return False
+    
+    def refresh_context_cache(self):
+        """Extend the cached content TTL so it survives long monitoring sessions"""
+        if self._cached_content is None:
+            return
+        try:
+            self._cached_content.update(ttl=timedelta(seconds=self.config.context_cache_ttl_seconds))
+        except Exception:
+            # Cache expired or was deleted server-side; fall back to full prompts
+            self._cached_content = None
+            self._cached_model = None
+    
+    def disable_context_cache(self):
+        """Delete the cached content and return to sending full prompts"""
+        cached_content = self._cached_content
+        self._cached_content = None
+        self._cached_model = None
+        if cached_content is not None:
+            try:
+                cached_content.delete()
+            except Exception:
+                pass
     
     def _parse_analysis_response(self, response_text: str) -> ContentAnalysisResult:
         """Parse the Gemini response into a structured result"""
@@ -230,7 +373,7 @@ IMPORTANT: Return ONLY the JSON object, no additional text.
         try:
             prompt = self._create_analysis_prompt(text, has_image=False)
             
-            response = self.model.generate_content(
+            response = self._generation_model().generate_content(
                 prompt,
                 generation_config=genai.types.GenerationConfig(
                     max_output_tokens=self.config.max_response_tokens,
@@ -270,7 +413,7 @@ IMPORTANT: Return ONLY the JSON object, no additional text.
             }
             
             # Generate content with multimodal input
-            response = self.model.generate_content(
+            response = self._generation_model().generate_content(
                 [prompt, image_part],
                 generation_config=genai.types.GenerationConfig(
                     max_output_tokens=self.config.max_response_tokens,
@@ -568,9 +711,16 @@ def configure_analysis_settings_tool(tool_context: ToolContext) -> Dict[str, Any
             assess_educational_value=True
         )
         
-        # Update global analyzer instance
+        # Update global analyzer instance. Unchanged settings keep the current
+        # analyzer so its context cache survives repeated configuration calls.
         global _analyzer_instance
-        _analyzer_instance = GeminiMultimodalAnalyzer(config)
+        previous = _analyzer_instance
+        if previous is None or previous.config != config:
+            _analyzer_instance = GeminiMultimodalAnalyzer(config)
+            if previous is not None and previous._cached_content is not None:
+                # The cached instructions depend on the config; recreate them for the new one
+                previous.disable_context_cache()
+                _analyzer_instance.enable_context_cache()
         
         # Update tool context state
         tool_context.state["analysis_config_updated"] = datetime.now().isoformat()
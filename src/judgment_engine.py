@@ -11,7 +11,7 @@ import json
 import logging
 import time
 import weave
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Callable, Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -101,6 +101,24 @@ class JudgmentConfig:
     learning_mode: bool = False
     custom_rules: List[JudgmentRule] = field(default_factory=list)
 
+# Condition keys understood by rule matching (see JudgmentEngine._rule_matches_conditions)
+_RULE_CONDITION_KEYS = frozenset({"category", "confidence", "emergency_keywords", "safety_concerns"})
+
+def _validate_rule_conditions(rule: JudgmentRule):
+    """Reject rule conditions that _rule_matches_conditions would misread or ignore"""
+    conditions = rule.conditions
+    unknown = set(conditions) - _RULE_CONDITION_KEYS
+    if unknown:
+        raise ValueError(f"Rule {rule.rule_id} has unknown conditions: {sorted(unknown)}")
+    
+    if "confidence" in conditions:
+        conf_conditions = conditions["confidence"]
+        if not isinstance(conf_conditions, dict) or set(conf_conditions) - {"min", "max"}:
+            raise ValueError(f"Rule {rule.rule_id} has an invalid confidence condition: {conf_conditions!r}")
+    
+    if "safety_concerns" in conditions and not isinstance(conditions["safety_concerns"], (str, list)):
+        raise ValueError(f"Rule {rule.rule_id} has an invalid safety_concerns condition: {conditions['safety_concerns']!r}")
+
 class JudgmentEngine(weave.Model):
     """
     Judgment Engine that processes analysis results and applies rules
@@ -138,6 +156,7 @@ class JudgmentEngine(weave.Model):
         # Initialize rules
         object.__setattr__(self, 'rules', [])
         object.__setattr__(self, 'judgment_history', [])
+        object.__setattr__(self, '_compiled_judge', None)
         object.__setattr__(self, 'stats', {
             'total_judgments': 0,
             'action_counts': {action.value: 0 for action in JudgmentAction},
@@ -329,40 +348,10 @@ class JudgmentEngine(weave.Model):
         start_time = time.time()
         
         try:
-            # Extract analysis data
-            category = analysis_result.get('category', 'unknown')
-            confidence = analysis_result.get('confidence', 0.0)
-            safety_concerns = analysis_result.get('safety_concerns', [])
-            input_text = analysis_result.get('input_text', '')
-            
-            # Check for emergency conditions
-            emergency_flag = self._check_emergency_conditions(input_text, safety_concerns)
-            
-            # Find applicable rules
-            applicable_rules = self._find_applicable_rules(analysis_result)
-            
-            # Apply rules to determine action
-            action, reasoning, applied_rule_ids = self._apply_rules(applicable_rules, analysis_result)
-            
-            # Create judgment result
-            result = JudgmentResult(
-                timestamp=datetime.now(),
-                action=action,
-                confidence=confidence,
-                reasoning=reasoning,
-                applied_rules=applied_rule_ids,
-                analysis_input=analysis_result,
-                emergency_flag=emergency_flag
-            )
-            
-            # Update statistics
-            self._update_statistics(result)
-            
-            # Store in history
-            self.judgment_history.append(result)
+            result = self.compile_judge()(analysis_result)
             
             judgment_time = time.time() - start_time
-            logger.info(f"Judgment completed in {judgment_time:.3f}s - Action: {action.value}, Category: {category}")
+            logger.info(f"Judgment completed in {judgment_time:.3f}s - Action: {result.action.value}, Category: {analysis_result.get('category', 'unknown')}")
             
             return result
             
@@ -371,16 +360,72 @@ class JudgmentEngine(weave.Model):
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
             
-            # Return fallback judgment
-            return JudgmentResult(
-                timestamp=datetime.now(),
-                action=JudgmentAction.MONITOR,
-                confidence=0.0,
-                reasoning=f"Judgment failed: {str(e)}. Defaulting to monitor for safety.",
-                applied_rules=["FALLBACK"],
-                analysis_input=analysis_result,
-                emergency_flag=True
-            )
+            return self._fallback_judgment(analysis_result, e)
+    
+    def compile_judge(self) -> Callable[[Dict[str, Any]], JudgmentResult]:
+        """
+        Return a judge callable for the active rule set, compiling it on first use
+        
+        Rules are filtered by age group, strictness and enabled state, sorted by priority
+        and validated once; each call then only runs the condition matchers. The callable
+        records statistics and history like judge_content, which delegates to it. The
+        cached judge is dropped by configure_judgment_settings and add_custom_rule.
+        
+        Raises:
+            ValueError: If an active rule has malformed conditions
+        """
+        judge = self._compiled_judge
+        if judge is not None:
+            return judge
+        
+        active_rules = self._active_rules()
+        for rule in active_rules:
+            _validate_rule_conditions(rule)
+        
+        def judge(analysis_result: Dict[str, Any]) -> JudgmentResult:
+            try:
+                emergency_flag = self._check_emergency_conditions(
+                    analysis_result.get('input_text', ''),
+                    analysis_result.get('safety_concerns', [])
+                )
+                applicable_rules = [rule for rule in active_rules if self._rule_matches_conditions(rule, analysis_result)]
+                action, reasoning, applied_rule_ids = self._apply_rules(applicable_rules, analysis_result)
+                
+                result = JudgmentResult(
+                    timestamp=datetime.now(),
+                    action=action,
+                    confidence=analysis_result.get('confidence', 0.0),
+                    reasoning=reasoning,
+                    applied_rules=applied_rule_ids,
+                    analysis_input=analysis_result,
+                    emergency_flag=emergency_flag
+                )
+                self._update_statistics(result)
+                self.judgment_history.append(result)
+                return result
+            
+            except Exception as e:
+                logger.error(f"Judgment error: {e}")
+                return self._fallback_judgment(analysis_result, e)
+        
+        object.__setattr__(self, '_compiled_judge', judge)
+        return judge
+    
+    def _invalidate_compiled_judge(self):
+        """Drop the cached judge so the next judgment recompiles the active rule set"""
+        object.__setattr__(self, '_compiled_judge', None)
+    
+    def _fallback_judgment(self, analysis_result: Dict[str, Any], error: Exception) -> JudgmentResult:
+        """Monitor-for-safety result used when judgment fails"""
+        return JudgmentResult(
+            timestamp=datetime.now(),
+            action=JudgmentAction.MONITOR,
+            confidence=0.0,
+            reasoning=f"Judgment failed: {str(error)}. Defaulting to monitor for safety.",
+            applied_rules=["FALLBACK"],
+            analysis_input=analysis_result,
+            emergency_flag=True
+        )
     
     def _check_emergency_conditions(self, input_text: str, safety_concerns: List[str]) -> bool:
         """Check for emergency conditions"""
@@ -400,9 +445,9 @@ class JudgmentEngine(weave.Model):
         
         return False
     
-    def _find_applicable_rules(self, analysis_result: Dict[str, Any]) -> List[JudgmentRule]:
-        """Find rules applicable to the analysis result"""
-        applicable_rules = []
+    def _active_rules(self) -> List[JudgmentRule]:
+        """Enabled rules for the current age group and strictness, highest priority first"""
+        active_rules = []
         
         for rule in self.rules:
             if not rule.enabled:
@@ -416,14 +461,16 @@ class JudgmentEngine(weave.Model):
             if rule.strictness_levels and self.config.strictness_level not in rule.strictness_levels:
                 continue
             
-            # Check rule conditions
-            if self._rule_matches_conditions(rule, analysis_result):
-                applicable_rules.append(rule)
+            active_rules.append(rule)
         
         # Sort by priority (higher priority first)
-        applicable_rules.sort(key=lambda r: r.priority, reverse=True)
+        active_rules.sort(key=lambda r: r.priority, reverse=True)
         
-        return applicable_rules
+        return active_rules
+    
+    def _find_applicable_rules(self, analysis_result: Dict[str, Any]) -> List[JudgmentRule]:
+        """Find rules applicable to the analysis result"""
+        return [rule for rule in self._active_rules() if self._rule_matches_conditions(rule, analysis_result)]
     
     def _rule_matches_conditions(self, rule: JudgmentRule, analysis_result: Dict[str, Any]) -> bool:
         """Check if a rule's conditions match the analysis result"""
@@ -574,6 +621,8 @@ class JudgmentEngine(weave.Model):
                                    strictness_level: Optional[str] = None,
                                    emergency_keywords: Optional[List[str]] = None):
         """Configure judgment settings"""
+        self._invalidate_compiled_judge()
+        
         if age_group:
             try:
                 new_age_group = AgeGroup(age_group)
@@ -633,6 +682,7 @@ class JudgmentEngine(weave.Model):
             )
             
             self.rules.append(custom_rule)
+            self._invalidate_compiled_judge()
             logger.info(f"Added custom rule: {custom_rule.name}")
             return True
             
@@ -119,6 +119,11 @@ class EnhancedKeylogger:
         """Add callback to be called when input is complete"""
         self.completion_callbacks.append(callback)
     
+    def remove_completion_callback(self, callback):
+        """Remove a previously added completion callback"""
+        if callback in self.completion_callbacks:
+            self.completion_callbacks.remove(callback)
+    
     def _log_keystroke(self, key_info: str) -> None:
         """Log keystroke to file and console"""
         ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
@@ -145,6 +150,8 @@ class EnhancedKeylogger:
                     self._log_keystroke("Key.space")
                     self.buffer.add_char(' ')
                     log_timing("1_INPUT_DETECTED", timestamp_1, self.buffer.text, "space_key")
+                    # A word boundary can complete substantial input
+                    self._check_completion()
                 elif key == keyboard.Key.backspace:
                     self._log_keystroke("Key.backspace")
                     # Handle backspace by removing last character
@@ -12,74 +12,88 @@ The agent provides a unified interface for the complete parental control workflo
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import json
 import logging
+import math
 import time
 import weave
-from typing import Dict, List, Optional, Tuple, Any, Union
-from dataclasses import dataclass, field
+from typing import Callable, Dict, Final, List, Optional, Tuple, TypedDict, Any, Union
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import islice
 from pathlib import Path
+from collections import Counter, OrderedDict, deque
 import threading
-import queue
 import os
 
-from google.adk import Agent, Runner
+from google.adk import Agent
 from google.adk.tools import FunctionTool
 
+# orjson is optional; fall back to the standard library serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# uvloop is optional (and unavailable on Windows); fall back to the default asyncio loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Import all component tools
 from key import (
-    start_keylogger_tool,
     start_keylogger,
-    stop_keylogger_tool,
     stop_keylogger,
-    get_current_input_tool,
     get_current_input,
-    clear_input_buffer_tool,
     clear_input_buffer,
-    create_monitoring_agent as create_keylogger_agent
-)
-from screen_capture import (
-    capture_screen_tool,
-    get_monitor_info_tool,
-    cleanup_temp_files_tool,
-    capture_on_input_complete_tool,
-    create_screen_capture_agent
+    get_keylogger_instance
 )
+from screen_capture import cleanup_temp_files_tool
+from gemini_multimodal import get_analyzer_instance
+from semantic_cache import SemanticCache
 from analysis_agent import (
     AnalysisAgent,
-    AnalysisResult,
-    create_analysis_agent
+    AnalysisResult
 )
 from judgment_engine import (
     JudgmentEngine,
     JudgmentResult,
     JudgmentAction,
-    create_judgment_agent
+    JudgmentConfig,
+    AgeGroup,
+    StrictnessLevel
 )
 from notification_agent import (
     NotificationAgent,
-    NotificationHelper,
     NotificationConfig
 )
 from session_manager import (
     SessionManager,
-    SessionInfo,
     EventRecord,
     get_global_session_manager
 )
 from websocket_server import (
     get_websocket_server,
     send_system_lock_notification,
-    send_approval_request,
     send_activity_update,
     update_system_status
 )
-from approval_manager import (
-    get_approval_manager,
-    request_approval
-)
+from approval_manager import request_approval
+
+# Judgment actions compared on every processed event
+_ALLOW = JudgmentAction.ALLOW
+_BLOCK = JudgmentAction.BLOCK
+_RESTRICT = JudgmentAction.RESTRICT
+
+@functools.lru_cache(maxsize=8)
+def _judgment_enums(age_group: str, strictness_level: str) -> Tuple[AgeGroup, StrictnessLevel]:
+    """Resolve config strings to judgment-engine enums once per distinct pair"""
+    return AgeGroup(age_group), StrictnessLevel(strictness_level)
 
 # Configure logging
 logging.basicConfig(
@@ -106,7 +120,116 @@ def get_precise_timestamp():
 
 def log_timing(phase: str, timestamp: float, input_text: str = "", extra_info: str = ""):
     """Log timing information for performance analysis"""
-    logger.info(f"⏱️ TIMING [{phase}] {timestamp:.6f}s - {input_text[:20]}{'...' if len(input_text) > 20 else ''} {extra_info}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("⏱️ TIMING [%s] %.6fs - %s%s %s", phase, timestamp, input_text[:20],
+                    '...' if len(input_text) > 20 else '', extra_info)
+
+# How long get_recent_events falls back to local history after a session-manager failure (seconds)
+SESSION_MANAGER_RETRY_DELAY = 5.0
+
+# Queued notifications arriving within this window (seconds) are delivered together
+NOTIFICATION_BATCH_WINDOW = 0.05
+NOTIFICATION_BATCH_MAX = 32
+
+# Maximum number of cached process_manual_input results
+MANUAL_CACHE_MAXSIZE = 128
+
+def _file_digest(path: Optional[str]) -> Optional[str]:
+    """MD5 of a file's contents, or None when there is no readable file"""
+    if not path:
+        return None
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.md5(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def _manual_cache_key(input_text: str, screenshot_path: Optional[str],
+                      age_group: str, strictness_level: str) -> str:
+    """Cache key for process_manual_input results"""
+    parts = (input_text.strip().lower(), _file_digest(screenshot_path) or '', age_group, strictness_level)
+    return hashlib.sha1('\x1f'.join(parts).encode()).hexdigest()
+
+class _MockToolContext:
+    """Minimal stand-in for an ADK ToolContext when calling component tools directly"""
+    __slots__ = ('state',)
+    
+    def __init__(self):
+        self.state = {}
+
+# Shared tool context; the component tools only write status keys into its state
+_MOCK_CTX = _MockToolContext()
+
+# Session-manager event batching: flush at this many events or after this long (seconds)
+EVENT_BATCH_SIZE = 16
+EVENT_BATCH_INTERVAL = 1.0
+
+# Number of processed events kept in memory for get_recent_events
+EVENT_HISTORY_LIMIT = 100
+
+# How long stop_monitoring lets an in-flight input event finish before cancelling it (seconds)
+EVENT_SHUTDOWN_TIMEOUT = 10.0
+
+# How often idle monitoring ticks extend the Gemini context cache TTL (seconds)
+CONTEXT_CACHE_REFRESH_INTERVAL = 600.0
+
+# Maximum delay before batched statistics increments become visible (seconds)
+STATS_FLUSH_INTERVAL = 1.0
+
+# How long get_recent_events may reuse a session-manager result (seconds)
+EVENTS_CACHE_TTL = 0.5
+
+class _SecondFormatter:
+    """Formats whole epoch seconds as local time, reusing the last string within a second"""
+    
+    def __init__(self, fmt: str):
+        self._fmt = fmt
+        # (second, formatted) swapped in one assignment so readers never see a torn pair
+        self._last = (-1, "")
+    
+    def __call__(self, second: int) -> str:
+        last_second, last_str = self._last
+        if second == last_second:
+            return last_str
+        formatted = time.strftime(self._fmt, time.localtime(second))
+        self._last = (second, formatted)
+        return formatted
+
+# Notification and ISO (status/config responses) timestamps
+_notif_second = _SecondFormatter("%Y-%m-%d %H:%M:%S")
+_iso_second = _SecondFormatter("%Y-%m-%dT%H:%M:%S")
+
+def _fmt_now() -> str:
+    """Get the current local time formatted for notifications"""
+    return _notif_second(int(time.time()))
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop for the agent, using uvloop when available"""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+async def _cancel_pending_tasks():
+    """Cancel every other task on the running loop and wait for them to finish"""
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a response to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode()
+
+def _iso_now() -> str:
+    """Get the current local time in ISO format at one-second resolution"""
+    return _iso_second(int(time.time()))
+
+def _fast_iso(ts: float) -> str:
+    """Format an epoch timestamp as local ISO time with microseconds"""
+    second = int(ts)
+    return f"{_iso_second(second)}.{int((ts - second) * 1e6):06d}"
 
 class MonitoringStatus(Enum):
     """Monitoring system status"""
@@ -116,18 +239,52 @@ class MonitoringStatus(Enum):
     PAUSED = "paused"
     ERROR = "error"
 
-@dataclass
 class MonitoringEvent:
     """Event data structure for monitoring workflow"""
-    timestamp: datetime
-    event_type: str
-    input_text: str
-    screenshot_path: Optional[str]
-    analysis_result: Optional[AnalysisResult]
-    judgment_result: Optional[JudgmentResult]
-    notification_sent: bool
-    processing_time: float
-    error: Optional[str] = None
+    # Slotted by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        'timestamp', 'event_type', 'input_text', 'screenshot_path', 'analysis_result',
+        'judgment_result', 'notification_sent', 'processing_time', 'error'
+    )
+    
+    def __init__(self,
+                 timestamp: datetime,
+                 event_type: str,
+                 input_text: str,
+                 screenshot_path: Optional[str],
+                 analysis_result: Optional[AnalysisResult],
+                 judgment_result: Optional[JudgmentResult],
+                 notification_sent: bool,
+                 processing_time: float,
+                 error: Optional[str] = None):
+        self.timestamp = timestamp
+        self.event_type = event_type
+        self.input_text = input_text
+        self.screenshot_path = screenshot_path
+        self.analysis_result = analysis_result
+        self.judgment_result = judgment_result
+        self.notification_sent = notification_sent
+        self.processing_time = processing_time
+        self.error = error
+    
+    def __repr__(self) -> str:
+        return (f"MonitoringEvent(timestamp={self.timestamp!r}, event_type={self.event_type!r}, "
+                f"input_text={self.input_text!r}, error={self.error!r})")
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Materialize the recent-events response format for this event"""
+        analysis_result = self.analysis_result
+        judgment_result = self.judgment_result
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "event_type": self.event_type,
+            "input_text": _truncate(self.input_text),
+            "category": analysis_result.category if analysis_result else None,
+            "action": judgment_result.action.value if judgment_result else None,
+            "notification_sent": self.notification_sent,
+            "processing_time": self.processing_time,
+            "error": self.error
+        }
 
 @dataclass
 class MonitoringConfig:
@@ -138,14 +295,130 @@ class MonitoringConfig:
     enable_emergency_alerts: bool = True
     screenshot_on_input: bool = True
     cache_enabled: bool = True
-    monitoring_interval: float = 0.5  # seconds
+    semantic_cache_threshold: float = 0.92  # cosine similarity for a semantic cache hit
+    semantic_cache_ttl: float = 3600.0  # seconds
+    cache_ttl: float = 300.0  # seconds a cached manual-input result stays valid
+    max_events: int = EVENT_HISTORY_LIMIT  # processed events kept in memory
+    max_input_length: int = 500  # characters; longer manual inputs are rejected unanalyzed
+    monitoring_interval: float = 0.5  # seconds (back-off after monitoring loop errors)
     input_completion_threshold: int = 10  # characters
+    enable_tracing: bool = True  # Weave tracing for status/events/config reads
     notification_config: Optional[NotificationConfig] = None
     
     def __post_init__(self):
         if self.notification_config is None:
             self.notification_config = NotificationConfig()
 
+def _config_setter(name: str) -> Callable[[MonitoringConfig, Any], None]:
+    """Create a setter for a single MonitoringConfig field"""
+    def setter(config: MonitoringConfig, value: Any) -> None:
+        setattr(config, name, value)
+    return setter
+
+# Precomputed setters for configure_monitoring, keyed by MonitoringConfig field name
+_CONFIG_SETTERS: Dict[str, Callable[[MonitoringConfig, Any], None]] = {
+    f.name: _config_setter(f.name) for f in fields(MonitoringConfig)
+}
+
+# Config keys that require reconfiguring the analysis agent and judgment engine
+_COMPONENT_CONFIG_KEYS = frozenset({'age_group', 'strictness_level'})
+
+# Config keys baked into the specialized manual-input pipeline
+_PIPELINE_CONFIG_KEYS = frozenset({'cache_enabled', 'enable_notifications'})
+
+def _judgment_input(input_text: str, analysis_result: AnalysisResult) -> Dict[str, Any]:
+    """Project an AnalysisResult onto the fields the judgment engine consumes"""
+    return {
+        'input_text': input_text,
+        'category': analysis_result.category,
+        'confidence': analysis_result.confidence,
+        'age_appropriateness': analysis_result.age_appropriateness,
+        'safety_concerns': analysis_result.safety_concerns,
+        'educational_value': analysis_result.educational_value,
+        'parental_action': analysis_result.parental_action,
+        'context_summary': analysis_result.context_summary
+    }
+
+def _results_to_dict(analysis_result: AnalysisResult, judgment_result: JudgmentResult) -> Dict[str, Any]:
+    """Serialize an (analysis, judgment) pair to JSON-compatible data for the semantic cache"""
+    analysis = asdict(analysis_result)
+    analysis['timestamp'] = analysis_result.timestamp.isoformat()
+    judgment = asdict(judgment_result)
+    judgment['timestamp'] = judgment_result.timestamp.isoformat()
+    judgment['action'] = judgment_result.action.value
+    return {'analysis': analysis, 'judgment': judgment}
+
+def _results_from_dict(data: Dict[str, Any]) -> Tuple[AnalysisResult, JudgmentResult]:
+    """Rebuild an (analysis, judgment) pair stored by _results_to_dict"""
+    analysis = dict(data['analysis'])
+    analysis['timestamp'] = datetime.fromisoformat(analysis['timestamp'])
+    judgment = dict(data['judgment'])
+    judgment['timestamp'] = datetime.fromisoformat(judgment['timestamp'])
+    judgment['action'] = JudgmentAction(judgment['action'])
+    return AnalysisResult(**analysis), JudgmentResult(**judgment)
+
+def _truncate(text: str, max_length: int = 100) -> str:
+    """Truncate text for event listings, only allocating when it is too long"""
+    return text if len(text) <= max_length else text[:max_length] + "..."
+
+def _record_to_dict(record: EventRecord) -> Dict[str, Any]:
+    """Convert a persisted EventRecord into the recent-events response format"""
+    return {
+        "timestamp": record.timestamp.isoformat(),
+        "event_type": record.event_type,
+        "input_text": _truncate(record.input_text),
+        "category": record.analysis_category,
+        "action": record.judgment_action,
+        "notification_sent": record.notification_sent,
+        "processing_time": record.processing_time,
+        "error": record.error
+    }
+
+def _event_record_data(event: MonitoringEvent) -> Dict[str, Any]:
+    """Convert an analyzed MonitoringEvent into session-manager event data"""
+    analysis_result = event.analysis_result
+    judgment_result = event.judgment_result
+    return {
+        'timestamp': event.timestamp,
+        'event_type': event.event_type,
+        'input_text': event.input_text,
+        'screenshot_path': event.screenshot_path,
+        'analysis_category': analysis_result.category,
+        'analysis_confidence': analysis_result.confidence,
+        'judgment_action': judgment_result.action.value if judgment_result else None,
+        'judgment_confidence': judgment_result.confidence if judgment_result else None,
+        'notification_sent': event.notification_sent,
+        'processing_time': event.processing_time,
+        'error': event.error
+    }
+
+# Small pool for blocking component tool calls (keylogger hooks, buffer locks, temp
+# file cleanup) made from coroutines, so they do not stall the event loop
+_io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="mon-io")
+
+async def _run_io(func: Callable[..., Any], *args) -> Any:
+    """Run a blocking component tool call on the I/O pool"""
+    return await asyncio.get_running_loop().run_in_executor(_io_executor, func, *args)
+
+@dataclass
+class _Runtime:
+    """Mutable MonitoringAgent state kept off the Pydantic model"""
+    status: MonitoringStatus = MonitoringStatus.STOPPED
+    session_id: Optional[str] = None
+    monitoring_thread: Optional[threading.Thread] = None
+    # Input event the monitoring thread is waiting on, running on the processing loop
+    inflight_event: Optional[concurrent.futures.Future] = None
+    event_history: deque = field(default_factory=lambda: deque(maxlen=EVENT_HISTORY_LIMIT))
+    statistics: Dict[str, Any] = field(default_factory=dict)
+
+def _runtime_property(name: str) -> property:
+    """Expose a _Runtime field as a plain MonitoringAgent attribute"""
+    def getter(self):
+        return getattr(self._rt, name)
+    def setter(self, value):
+        setattr(self._rt, name, value)
+    return property(getter, setter, doc=f"Runtime state: {name}")
+
 class MonitoringAgent(weave.Model):
     """
     Main Monitoring Agent for Parental Control System
@@ -162,17 +435,28 @@ class MonitoringAgent(weave.Model):
     # Define model configuration to allow extra fields
     model_config = {"extra": "allow"}
     
+    # Frequently written runtime state lives on self._rt
+    status = _runtime_property('status')
+    session_id = _runtime_property('session_id')
+    monitoring_thread = _runtime_property('monitoring_thread')
+    event_history = _runtime_property('event_history')
+    statistics = _runtime_property('statistics')
+    
     def __init__(self, config: Optional[MonitoringConfig] = None, debug_window=None):
         super().__init__()
         
         # Use object.__setattr__ to set attributes on Pydantic model
         object.__setattr__(self, 'config', config or MonitoringConfig())
-        object.__setattr__(self, 'status', MonitoringStatus.STOPPED)
-        object.__setattr__(self, 'event_history', [])
-        object.__setattr__(self, 'session_id', None)
-        object.__setattr__(self, 'monitoring_thread', None)
+        # Mutable runtime state (status, session_id, monitoring_thread, event_history, statistics)
+        object.__setattr__(self, '_rt', _Runtime(
+            event_history=deque(maxlen=self.config.max_events or EVENT_HISTORY_LIMIT)
+        ))
+        object.__setattr__(self, '_loop', None)
+        object.__setattr__(self, '_loop_thread', None)
         object.__setattr__(self, 'stop_event', threading.Event())
-        object.__setattr__(self, 'event_queue', queue.Queue())
+        # Input-completion signals from the keylogger thread; deque appends are atomic
+        object.__setattr__(self, 'event_queue', deque())
+        object.__setattr__(self, '_event_ready', threading.Event())
         object.__setattr__(self, 'session_manager', get_global_session_manager())
         
         # Initialize component agents
@@ -182,24 +466,63 @@ class MonitoringAgent(weave.Model):
             cache_enabled=self.config.cache_enabled
         ))
         
-        from judgment_engine import JudgmentConfig, AgeGroup, StrictnessLevel
-        
         # Create judgment config
-        age_group_enum = AgeGroup(self.config.age_group)
-        strictness_enum = StrictnessLevel(self.config.strictness_level)
+        age_group_enum, strictness_enum = _judgment_enums(
+            self.config.age_group, self.config.strictness_level
+        )
         judgment_config = JudgmentConfig(
             age_group=age_group_enum,
             strictness_level=strictness_enum
         )
         
         object.__setattr__(self, 'judgment_engine', JudgmentEngine(config=judgment_config))
+        self._compile_judgment()
+        
+        # Serializes configure_monitoring with the processing paths, which run on other
+        # threads and loops: manual cache, last-input results and event history
+        object.__setattr__(self, '_config_lock', threading.RLock())
+        # Bumped whenever earlier judgments stop applying (age group / strictness changes)
+        object.__setattr__(self, '_config_generation', 0)
+        
+        # Manual-input results keyed by _manual_cache_key: key -> (stored_at, (analysis, judgment))
+        object.__setattr__(self, '_manual_cache', OrderedDict())
+        self._build_pipeline()
+        
+        # Last processed input (text + results), reused when the same text is typed again
+        object.__setattr__(self, '_last_input_text', None)
+        object.__setattr__(self, '_last_result', None)
+        
+        # Near-duplicate inputs reuse earlier analysis + judgment results. The cache
+        # loads an embedding model, so it is built on first use (see _get_semantic_cache)
+        object.__setattr__(self, 'semantic_cache', None)
+        object.__setattr__(self, '_semantic_cache_lock', threading.Lock())
         
         object.__setattr__(self, 'notification_agent', NotificationAgent(
             config=self.config.notification_config
         ))
         
+        object.__setattr__(self, '_child_name', self.config.notification_config.child_name)
+        
+        # Notifications queued by process_manual_input while monitoring is active,
+        # delivered in batches by a consumer task on start_monitoring's event loop
+        object.__setattr__(self, '_notif_queue', None)
+        object.__setattr__(self, '_notif_task', None)
+        # Session-manager writes scheduled from _process_input_event
+        object.__setattr__(self, '_inflight_records', set())
+        
+        # Processed events waiting to be recorded in one session-manager batch
+        object.__setattr__(self, '_pending_events', [])
+        object.__setattr__(self, '_pending_events_lock', threading.Lock())
+        object.__setattr__(self, '_events_flushed_at', time.monotonic())
+        
+        # Short-lived cache of session-manager recent events: (fetched_at, session_id, limit, events)
+        object.__setattr__(self, '_events_cache', (0.0, None, 0, []))
+        
+        # Circuit breaker for session-manager reads in get_recent_events
+        object.__setattr__(self, '_session_mgr_breaker', {"fail_until": 0.0})
+        
         # Statistics tracking
-        object.__setattr__(self, 'statistics', {
+        self._rt.statistics = {
             'total_events': 0,
             'inputs_processed': 0,
             'screenshots_taken': 0,
@@ -207,9 +530,30 @@ class MonitoringAgent(weave.Model):
             'judgments_made': 0,
             'notifications_sent': 0,
             'errors': 0,
+            'semantic_cache_hits': 0,
+            'duplicate_inputs': 0,
+            'cache_hits': 0,
             'average_processing_time': 0.0,
+            'total_processing_time': 0.0,
+            'total_processing_time_sq': 0.0,
+            'processing_time_std': 0.0,
             'session_start_time': None,
             'uptime': 0.0
+        }
+        
+        # Per-event counter increments are batched here and folded into
+        # `statistics` at most once per STATS_FLUSH_INTERVAL (and on every read)
+        object.__setattr__(self, '_stats_lock', threading.Lock())
+        object.__setattr__(self, '_stats_local', Counter())
+        object.__setattr__(self, '_stats_flushed_at', time.monotonic())
+        
+        # Cached config view returned by status/config responses; replaced by configure_monitoring
+        object.__setattr__(self, '_config_view', {
+            "age_group": self.config.age_group,
+            "strictness_level": self.config.strictness_level,
+            "enable_notifications": self.config.enable_notifications,
+            "screenshot_on_input": self.config.screenshot_on_input,
+            "cache_enabled": self.config.cache_enabled
         })
         
         # Store debug window reference
@@ -236,6 +580,11 @@ class MonitoringAgent(weave.Model):
             except Exception as e:
                 logging.error(f"Error logging to debug window: {e}")
     
+    @classmethod
+    async def acreate(cls, config: Optional[MonitoringConfig] = None, debug_window=None) -> 'MonitoringAgent':
+        """Construct an agent on the I/O pool so component setup does not block the event loop"""
+        return await _run_io(functools.partial(cls, config=config, debug_window=debug_window))
+    
     @weave.op()
     async def start_monitoring(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -259,17 +608,11 @@ class MonitoringAgent(weave.Model):
             if not session_id:
                 session_id = f"session_{int(time.time())}"
             
-            object.__setattr__(self, 'session_id', session_id)
-            object.__setattr__(self, 'status', MonitoringStatus.STARTING)
+            self._rt.session_id = session_id
+            self._rt.status = MonitoringStatus.STARTING
             
             # Create session in session manager
-            session_config = {
-                "age_group": self.config.age_group,
-                "strictness_level": self.config.strictness_level,
-                "enable_notifications": self.config.enable_notifications,
-                "screenshot_on_input": self.config.screenshot_on_input,
-                "cache_enabled": self.config.cache_enabled
-            }
+            session_config = dict(self._config_view)
             
             try:
                 self.session_manager.create_session(session_id, session_config)
@@ -279,35 +622,56 @@ class MonitoringAgent(weave.Model):
                 self.session_manager.create_session(session_id, session_config)
             
             # Start keylogger
-            class MockToolContext:
-                def __init__(self):
-                    self.state = {}
-            
-            context = MockToolContext()
-            keylogger_result = start_keylogger(context)
+            keylogger_result = await _run_io(start_keylogger, _MOCK_CTX)
             
             if keylogger_result.get('status') != 'success':
-                object.__setattr__(self, 'status', MonitoringStatus.ERROR)
+                self._rt.status = MonitoringStatus.ERROR
                 return {
                     "status": "error",
                     "error": "Failed to start keylogger",
                     "details": keylogger_result
                 }
             
+            # Wake the monitoring loop from the keylogger instead of polling it
+            self.event_queue.clear()
+            self._event_ready.clear()
+            get_keylogger_instance().add_completion_callback(self._on_input_complete)
+            
+            # Load the semantic cache's embedding model before the first input arrives
+            if self.config.cache_enabled:
+                _io_executor.submit(self._get_semantic_cache)
+            
+            # Cache the static analysis instructions server-side for this session
+            await _run_io(self._set_context_cache, True)
+            
+            # Start a persistent event loop for input processing so async clients
+            # stay warm across events instead of a new loop per event
+            loop = _new_event_loop()
+            loop_thread = threading.Thread(
+                target=loop.run_forever,
+                name="monitoring-event-loop",
+                daemon=True
+            )
+            loop_thread.start()
+            object.__setattr__(self, '_loop', loop)
+            object.__setattr__(self, '_loop_thread', loop_thread)
+            
             # Reset stop event and start monitoring thread
             self.stop_event.clear()
-            object.__setattr__(self, 'monitoring_thread', threading.Thread(
+            self._rt.monitoring_thread = threading.Thread(
                 target=self._monitoring_loop,
                 daemon=True
-            ))
-            self.monitoring_thread.start()
+            )
+            self._rt.monitoring_thread.start()
+            
+            # Start delivering queued notifications on this loop
+            self._start_notification_consumer()
             
             # Update statistics
-            new_stats = dict(self.statistics)
-            new_stats['session_start_time'] = datetime.now()
-            object.__setattr__(self, 'statistics', new_stats)
+            with self._stats_lock:
+                self.statistics['session_start_time'] = datetime.now()
             
-            object.__setattr__(self, 'status', MonitoringStatus.ACTIVE)
+            self._rt.status = MonitoringStatus.ACTIVE
             
             # Notify WebSocket clients that monitoring has started
             update_system_status("monitoring", "good")
@@ -318,12 +682,12 @@ class MonitoringAgent(weave.Model):
                 "status": "success",
                 "session_id": session_id,
                 "message": "Monitoring started successfully",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _fast_iso(time.time())
             }
             
         except Exception as e:
             logger.error(f"Error starting monitoring: {e}")
-            object.__setattr__(self, 'status', MonitoringStatus.ERROR)
+            self._rt.status = MonitoringStatus.ERROR
             
             # Notify WebSocket clients of error
             update_system_status("offline", "disconnected")
@@ -331,7 +695,7 @@ class MonitoringAgent(weave.Model):
             return {
                 "status": "error",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _fast_iso(time.time())
             }
     
     @weave.op()
@@ -349,35 +713,67 @@ class MonitoringAgent(weave.Model):
                     "message": "Monitoring is already stopped"
                 }
             
-            # Signal stop to monitoring thread
+            # Signal stop to monitoring thread and wake its wait
             self.stop_event.set()
+            get_keylogger_instance().remove_completion_callback(self._on_input_complete)
+            self._event_ready.set()
+            
+            # Let the event being processed finish (its approval request and
+            # notification), cancelling it if it takes too long
+            inflight_event = self._rt.inflight_event
+            if inflight_event is not None:
+                done, _ = await asyncio.wait(
+                    {asyncio.wrap_future(inflight_event)}, timeout=EVENT_SHUTDOWN_TIMEOUT
+                )
+                if not done:
+                    logger.warning("Cancelling input event still processing at shutdown")
+                    inflight_event.cancel()
             
             # Wait for thread to finish
             if self.monitoring_thread and self.monitoring_thread.is_alive():
-                self.monitoring_thread.join(timeout=5.0)
+                await _run_io(self.monitoring_thread.join, 5.0)
             
-            # Stop keylogger
-            class MockToolContext:
-                def __init__(self):
-                    self.state = {}
+            # Deliver notifications still queued from manual processing
+            await self._drain_notifications()
+            
+            # Stop the processing event loop once its remaining tasks have been cancelled
+            if self._loop is not None:
+                try:
+                    await asyncio.wait_for(asyncio.wrap_future(
+                        asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), self._loop)
+                    ), timeout=5.0)
+                except asyncio.TimeoutError:
+                    logger.warning("Timed out cancelling processing tasks")
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                await _run_io(self._loop_thread.join, 5.0)
+                if not self._loop_thread.is_alive():
+                    self._loop.close()
+                object.__setattr__(self, '_loop', None)
+                object.__setattr__(self, '_loop_thread', None)
+            
+            # Release the session's Gemini context cache
+            await _run_io(self._set_context_cache, False)
             
-            context = MockToolContext()
-            stop_keylogger(context)
+            # Stop keylogger
+            await _run_io(stop_keylogger, _MOCK_CTX)
             
             # Clean up temporary files
-            cleanup_temp_files_tool(context)
+            await _run_io(cleanup_temp_files_tool, _MOCK_CTX)
+            
+            # Record any batched events before the session ends
+            self._flush_event_records(force=True)
             
             # End session in session manager
             if self.session_id:
                 self.session_manager.end_session(self.session_id)
             
             # Update statistics
-            new_stats = dict(self.statistics)
-            if new_stats['session_start_time']:
-                new_stats['uptime'] = (datetime.now() - new_stats['session_start_time']).total_seconds()
-            object.__setattr__(self, 'statistics', new_stats)
+            with self._stats_lock:
+                self._flush_stats_locked()
+                if self.statistics['session_start_time']:
+                    self.statistics['uptime'] = (datetime.now() - self.statistics['session_start_time']).total_seconds()
             
-            object.__setattr__(self, 'status', MonitoringStatus.STOPPED)
+            self._rt.status = MonitoringStatus.STOPPED
             
             # Notify WebSocket clients that monitoring has stopped
             update_system_status("offline", "disconnected")
@@ -395,7 +791,7 @@ class MonitoringAgent(weave.Model):
                 "status": "success",
                 "message": "Monitoring stopped successfully",
                 "session_summary": session_summary,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _fast_iso(time.time())
             }
             
         except Exception as e:
@@ -403,7 +799,7 @@ class MonitoringAgent(weave.Model):
             return {
                 "status": "error",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _fast_iso(time.time())
             }
     
     def _monitoring_loop(self):
@@ -411,15 +807,28 @@ class MonitoringAgent(weave.Model):
         logger.info("Monitoring loop started")
         
         last_activity_update = time.time()
+        last_cache_refresh = last_activity_update
         activity_update_interval = 30  # Send activity updates every 30 seconds
         
         while not self.stop_event.is_set():
             try:
-                # Check for input completion
-                context = type('MockToolContext', (), {'state': {}})()
-                input_status = get_current_input(context)
+                # Block until the keylogger signals input completion (or the timeout
+                # elapses so periodic activity updates still go out)
+                self._event_ready.wait(timeout=1.0)
+                self._event_ready.clear()
+                
+                if self.stop_event.is_set():
+                    break
+                
+                input_status = None
+                if self.event_queue:
+                    # Coalesce completion signals queued while the previous input was processed
+                    self.event_queue.clear()
+                    
+                    # Read the current buffer, which may have grown since the signal
+                    input_status = get_current_input(_MOCK_CTX)
                 
-                if input_status.get('input_complete', False):
+                if input_status and input_status.get('input_complete', False):
                     # TIMING POINT 3: Monitoring loop detects completion
                     timestamp_3 = get_precise_timestamp()
                     input_text = ""
@@ -427,24 +836,24 @@ class MonitoringAgent(weave.Model):
                         input_text = input_status['buffer'].get('text', '')
                     log_timing("3_MONITORING_LOOP_DETECTS_COMPLETION", timestamp_3, input_text)
                     
-                    # Process the completed input
-                    # Use asyncio.create_task to avoid blocking the monitoring loop
+                    # Process the completed input on the persistent event loop
                     try:
-                        # Create a new event loop for this thread if none exists
+                        future = asyncio.run_coroutine_threadsafe(
+                            self._process_input_event(input_status),
+                            self._loop
+                        )
+                        self._rt.inflight_event = future
                         try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        
-                        # Run the async function in the current loop
-                        loop.run_until_complete(self._process_input_event(input_status))
+                            future.result()
+                        finally:
+                            self._rt.inflight_event = None
+                    except concurrent.futures.CancelledError:
+                        logger.warning("Input event processing cancelled by shutdown")
                     except Exception as e:
                         logger.error(f"Error processing input event: {e}")
                         # Clear input buffer to prevent loops
                         try:
-                            context = type('MockToolContext', (), {'state': {}})()
-                            clear_input_buffer(context)
+                            clear_input_buffer(_MOCK_CTX)
                         except Exception as clear_error:
                             logger.error(f"Error clearing input buffer: {clear_error}")
                 
@@ -463,24 +872,88 @@ class MonitoringAgent(weave.Model):
                     
                     last_activity_update = current_time
                 
-                # Wait before next check
-                time.sleep(self.config.monitoring_interval)
+                # Flush batched events that have waited past the batch interval
+                self._flush_event_records()
+                
+                # Keep the Gemini context cache alive across long sessions
+                if current_time - last_cache_refresh >= CONTEXT_CACHE_REFRESH_INTERVAL:
+                    try:
+                        get_analyzer_instance().refresh_context_cache()
+                    except Exception as cache_error:
+                        logger.warning(f"Error refreshing context cache: {cache_error}")
+                    last_cache_refresh = current_time
                 
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
                 # Update error statistics
-                new_stats = dict(self.statistics)
-                new_stats['errors'] += 1
-                object.__setattr__(self, 'statistics', new_stats)
+                self._record_stats(errors=1)
                 
                 # Continue monitoring despite errors
                 time.sleep(self.config.monitoring_interval)
         
         logger.info("Monitoring loop stopped")
     
+    def _set_context_cache(self, enabled: bool):
+        """Create or delete the Gemini context cache for the analysis instructions"""
+        try:
+            analyzer = get_analyzer_instance()
+            if not enabled:
+                analyzer.disable_context_cache()
+            elif analyzer.enable_context_cache():
+                logger.info("Gemini context cache enabled for analysis instructions")
+            else:
+                logger.info("Gemini context cache unavailable, sending full prompts")
+        except Exception as e:
+            logger.warning(f"Error updating context cache: {e}")
+    
+    def _get_semantic_cache(self) -> Optional[SemanticCache]:
+        """Return the semantic cache, building it on first use (blocking; run on the I/O pool)"""
+        with self._semantic_cache_lock:
+            if not self.config.cache_enabled:
+                return None
+            if self.semantic_cache is None:
+                object.__setattr__(self, 'semantic_cache', SemanticCache(
+                    threshold=self.config.semantic_cache_threshold,
+                    ttl_seconds=self.config.semantic_cache_ttl
+                ))
+            return self.semantic_cache
+    
+    def _close_semantic_cache(self):
+        """Close the semantic cache; it is rebuilt on next use if caching is enabled"""
+        with self._semantic_cache_lock:
+            semantic_cache = self.semantic_cache
+            object.__setattr__(self, 'semantic_cache', None)
+        if semantic_cache is not None:
+            semantic_cache.close()
+    
+    def _semantic_cache_get(self, input_text: str, namespace: str) -> Optional[Tuple[AnalysisResult, JudgmentResult]]:
+        """Look up results for a near-duplicate input (blocking; run on the I/O pool)"""
+        semantic_cache = self._get_semantic_cache()
+        if semantic_cache is None or not semantic_cache.available:
+            return None
+        data = semantic_cache.get(input_text, namespace)
+        return _results_from_dict(data) if data is not None else None
+    
+    def _semantic_cache_set(self, input_text: str, namespace: str,
+                            analysis_result: AnalysisResult, judgment_result: JudgmentResult):
+        """Store results for an input (blocking; run on the I/O pool)"""
+        try:
+            semantic_cache = self._get_semantic_cache()
+            if semantic_cache is not None:
+                semantic_cache.set(input_text, namespace, _results_to_dict(analysis_result, judgment_result))
+        except Exception as e:
+            logger.error(f"Error storing semantic cache entry: {e}")
+    
+    def _on_input_complete(self, buffer_info: Dict[str, Any]):
+        """Keylogger completion callback that wakes the monitoring loop"""
+        self.event_queue.append(buffer_info)
+        self._event_ready.set()
+    
     async def _process_input_event(self, input_status: Dict[str, Any]):
         """Process a completed input event through the full workflow"""
-        start_time = time.time()
+        # Monotonic clock for latency; wall clock read once per event
+        start_mono = time.monotonic()
+        event_time = datetime.now()
         
         # TIMING POINT 4: Process input event starts
         timestamp_4 = get_precise_timestamp()
@@ -496,11 +969,11 @@ class MonitoringAgent(weave.Model):
         
         # Skip processing if input is only whitespace/newlines
         if not input_text or not input_text.strip():
-            logger.debug("Skipping empty or whitespace-only input")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Skipping empty or whitespace-only input")
             # Clear input buffer to prevent loops
             try:
-                context = type('MockToolContext', (), {'state': {}})()
-                clear_input_buffer(context)
+                await _run_io(clear_input_buffer, _MOCK_CTX)
             except Exception as e:
                 logger.error(f"Error clearing input buffer: {e}")
             return
@@ -509,7 +982,7 @@ class MonitoringAgent(weave.Model):
         self.log_debug_entry(input_text, "processing")
         
         event = MonitoringEvent(
-            timestamp=datetime.now(),
+            timestamp=event_time,
             event_type="input_complete",
             input_text=input_text,
             screenshot_path=None,
@@ -532,73 +1005,103 @@ class MonitoringAgent(weave.Model):
                 event.screenshot_path = None
                 
                 # Update statistics (fake increment for consistency)
-                new_stats = dict(self.statistics)
-                new_stats['screenshots_taken'] += 1
-                object.__setattr__(self, 'statistics', new_stats)
+                self._record_stats(screenshots_taken=1)
             
-            # Step 2: Analyze content
             # Check if we should force analysis (for manual testing or certain conditions)
             should_force_analysis = hasattr(self, '_force_analysis') and self._force_analysis
             
-            analysis_result = await self.analysis_agent.analyze_input_context(
-                event.input_text, 
-                screenshot_path,
-                force_analysis=should_force_analysis
-            )
-            
-            # TIMING POINT 5: Analysis completion
-            timestamp_5 = get_precise_timestamp()
-            log_timing("5_ANALYSIS_COMPLETION", timestamp_5, input_text, f"analysis_time={(timestamp_5-timestamp_4):.2f}s")
-            
-            # If analysis returns None, input is incomplete - keep buffer and wait
-            if analysis_result is None:
-                logger.debug(f"Input incomplete, keeping buffer: '{input_text[:50]}...'")
-                # Log debug entry - incomplete input
-                self.log_debug_entry(input_text, "incomplete")
-                return  # Don't clear buffer, let input continue accumulating
-            
-            event.analysis_result = analysis_result
+            # The same text typed twice in a row reuses the previous results outright
+            with self._config_lock:
+                config_generation = self._config_generation
+                last_result = self._last_result if input_text == self._last_input_text else None
+            cached_results = None
+            use_semantic_cache = False
+            if last_result is not None and not should_force_analysis:
+                cached_results = last_result
+                log_timing("5_6_DUPLICATE_INPUT", get_precise_timestamp(), input_text)
+                self._record_stats(duplicate_inputs=1)
+            else:
+                # Near-duplicate text-only inputs reuse an earlier analysis + judgment
+                use_semantic_cache = (
+                    self.config.cache_enabled
+                    and screenshot_path is None and not should_force_analysis
+                )
+                if use_semantic_cache:
+                    cache_namespace = f"{self._rt.session_id or 'default'}:{self.config.age_group}:{self.config.strictness_level}"
+                    cached_results = await _run_io(self._semantic_cache_get, event.input_text, cache_namespace)
+                    if cached_results is not None:
+                        log_timing("5_6_SEMANTIC_CACHE_HIT", get_precise_timestamp(), input_text)
+                        self._record_stats(semantic_cache_hits=1)
             
-            # Update statistics
-            new_stats = dict(self.statistics)
-            new_stats['analyses_completed'] += 1
-            object.__setattr__(self, 'statistics', new_stats)
-            
-            # Step 3: Apply judgment
-            judgment_result = await self.judgment_engine.judge_content({
-                'input_text': event.input_text,
-                'category': analysis_result.category,
-                'confidence': analysis_result.confidence,
-                'age_appropriateness': analysis_result.age_appropriateness,
-                'safety_concerns': analysis_result.safety_concerns,
-                'educational_value': analysis_result.educational_value,
-                'parental_action': analysis_result.parental_action,
-                'context_summary': analysis_result.context_summary
-            })
-            event.judgment_result = judgment_result
-            
-            # TIMING POINT 6: Judgment completion
-            timestamp_6 = get_precise_timestamp()
-            log_timing("6_JUDGMENT_COMPLETION", timestamp_6, input_text, f"judgment_time={(timestamp_6-timestamp_5):.3f}s")
+            if cached_results is not None:
+                analysis_result, judgment_result = cached_results
+                event.analysis_result = analysis_result
+                event.judgment_result = judgment_result
+            else:
+                # Step 2: Analyze content
+                analysis_result = await self.analysis_agent.analyze_input_context(
+                    event.input_text, 
+                    screenshot_path,
+                    force_analysis=should_force_analysis
+                )
+                
+                # TIMING POINT 5: Analysis completion
+                timestamp_5 = get_precise_timestamp()
+                log_timing("5_ANALYSIS_COMPLETION", timestamp_5, input_text, f"analysis_time={(timestamp_5-timestamp_4):.2f}s")
+                
+                # If analysis returns None, input is incomplete - keep buffer and wait
+                if analysis_result is None:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Input incomplete, keeping buffer: '%s...'", input_text[:50])
+                    # Log debug entry - incomplete input
+                    self.log_debug_entry(input_text, "incomplete")
+                    return  # Don't clear buffer, let input continue accumulating
+                
+                event.analysis_result = analysis_result
+                
+                # Update statistics
+                self._record_stats(analyses_completed=1)
+                
+                # Step 3: Apply judgment
+                judgment_result = self._compiled_judge(
+                    _judgment_input(event.input_text, analysis_result)
+                )
+                event.judgment_result = judgment_result
+                
+                # TIMING POINT 6: Judgment completion
+                timestamp_6 = get_precise_timestamp()
+                log_timing("6_JUDGMENT_COMPLETION", timestamp_6, input_text, f"judgment_time={(timestamp_6-timestamp_5):.3f}s")
+                
+                # Update statistics
+                self._record_stats(judgments_made=1)
+                
+                if use_semantic_cache:
+                    # Embedding + insert run in the background; nothing waits on them
+                    _io_executor.submit(
+                        self._semantic_cache_set, event.input_text, cache_namespace,
+                        analysis_result, judgment_result
+                    )
             
-            # Update statistics
-            new_stats = dict(self.statistics)
-            new_stats['judgments_made'] += 1
-            object.__setattr__(self, 'statistics', new_stats)
+            # Remember this input for the duplicate check on the next event, unless the
+            # settings changed while it was being judged
+            with self._config_lock:
+                if config_generation == self._config_generation:
+                    object.__setattr__(self, '_last_input_text', input_text)
+                    object.__setattr__(self, '_last_result', (analysis_result, judgment_result))
             
             # Calculate processing time BEFORE blocking actions
-            processing_time_before_block = time.time() - start_time
+            processing_time_before_block = time.monotonic() - start_mono
             
             # TIMING POINT 7: Before blocking operations
             timestamp_7 = get_precise_timestamp()
             log_timing("7_BEFORE_BLOCKING_OPERATIONS", timestamp_7, input_text, f"core_processing_time={(timestamp_7-timestamp_4):.2f}s")
             
             # Step 4: Handle judgment results and send notifications
-            if judgment_result.action != JudgmentAction.ALLOW:
+            if judgment_result.action is not _ALLOW:
                 # Send WebSocket notifications for blocked content
-                if judgment_result.action == JudgmentAction.BLOCK:
+                if judgment_result.action is _BLOCK:
                     # Use approval manager to request approval and lock system
-                    logger.info(f"Requesting approval for blocked content: {analysis_result.category}")
+                    logger.info("Requesting approval for blocked content: %s", analysis_result.category)
                     request_id = request_approval(
                         reason=f"Inappropriate content detected: {analysis_result.category}",
                         content=event.input_text,
@@ -608,7 +1111,7 @@ class MonitoringAgent(weave.Model):
                         timeout_seconds=300  # 5 minutes timeout
                     )
                     
-                    logger.info(f"System locked with approval request: {request_id}")
+                    logger.info("System locked with approval request: %s", request_id)
                     
                     # Also send legacy WebSocket notifications for compatibility
                     send_system_lock_notification(
@@ -621,30 +1124,29 @@ class MonitoringAgent(weave.Model):
                 
                 # Send traditional notifications if enabled
                 if self.config.enable_notifications:
-                    await self._send_appropriate_notification(analysis_result, judgment_result)
+                    await self._send_appropriate_notification(
+                        analysis_result,
+                        judgment_result,
+                        timestamp=event_time.strftime("%Y-%m-%d %H:%M:%S")
+                    )
                     event.notification_sent = True
                     
                     # Update statistics
-                    new_stats = dict(self.statistics)
-                    new_stats['notifications_sent'] += 1
-                    object.__setattr__(self, 'statistics', new_stats)
+                    self._record_stats(notifications_sent=1)
             
             # Step 5: Clear input buffer only after successful analysis
-            context = type('MockToolContext', (), {'state': {}})()
-            clear_input_buffer(context)
+            await _run_io(clear_input_buffer, _MOCK_CTX)
             
             # Use the processing time calculated before blocking actions
             event.processing_time = processing_time_before_block
             
-            # Update statistics
-            new_stats = dict(self.statistics)
-            new_stats['total_events'] += 1
-            new_stats['inputs_processed'] += 1
-            new_stats['average_processing_time'] = (
-                (new_stats['average_processing_time'] * (new_stats['total_events'] - 1) + event.processing_time) /
-                new_stats['total_events']
+            # Update statistics (average_processing_time is derived on read)
+            self._record_stats(
+                total_events=1,
+                inputs_processed=1,
+                total_processing_time=event.processing_time,
+                total_processing_time_sq=event.processing_time * event.processing_time
             )
-            object.__setattr__(self, 'statistics', new_stats)
             
             # Log debug entry - complete processing
             self.log_debug_entry(
@@ -659,7 +1161,9 @@ class MonitoringAgent(weave.Model):
             timestamp_8 = get_precise_timestamp()
             log_timing("8_PROCESS_END", timestamp_8, input_text, f"total_time={(timestamp_8-timestamp_4):.2f}s")
             
-            logger.info(f"Processed input event: {analysis_result.category} -> {judgment_result.action.value} ({event.processing_time:.2f}s)")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Processed input event: %s -> %s (%.2fs)",
+                            analysis_result.category, judgment_result.action.value, event.processing_time)
             
         except Exception as e:
             logger.error(f"Error processing input event: {e}")
@@ -670,55 +1174,77 @@ class MonitoringAgent(weave.Model):
             
             # Always clear input buffer on error to prevent loops
             try:
-                context = type('MockToolContext', (), {'state': {}})()
-                clear_input_buffer(context)
+                await _run_io(clear_input_buffer, _MOCK_CTX)
             except Exception as clear_error:
                 logger.error(f"Error clearing input buffer after error: {clear_error}")
             
             # Update error statistics
-            new_stats = dict(self.statistics)
-            new_stats['errors'] += 1
-            object.__setattr__(self, 'statistics', new_stats)
+            self._record_stats(errors=1)
         
         # Record event in session manager only if analysis was completed
         if event.analysis_result is not None:
             try:
-                event_data = {
-                    'event_type': event.event_type,
-                    'input_text': event.input_text,
-                    'screenshot_path': event.screenshot_path,
-                    'analysis_category': event.analysis_result.category if event.analysis_result else None,
-                    'analysis_confidence': event.analysis_result.confidence if event.analysis_result else None,
-                    'judgment_action': event.judgment_result.action.value if event.judgment_result else None,
-                    'judgment_confidence': event.judgment_result.confidence if event.judgment_result else None,
-                    'notification_sent': event.notification_sent,
-                    'processing_time': event.processing_time,
-                    'error': event.error
-                }
-                self.session_manager.record_event(event_data)
+                # Batch session-manager writes and persist them off the critical path
+                if self._queue_event_record(event):
+                    record_task = asyncio.create_task(self._record_events_async())
+                    self._inflight_records.add(record_task)
+                    record_task.add_done_callback(self._inflight_records.discard)
             except Exception as e:
                 logger.error(f"Error recording event: {e}")
             
-            # Add event to history only if analysis was completed
-            new_history = list(self.event_history)
-            new_history.append(event)
-            # Keep only last 100 events
-            if len(new_history) > 100:
-                new_history = new_history[-100:]
-            object.__setattr__(self, 'event_history', new_history)
+            # Add event to history only if analysis was completed (deque drops the oldest)
+            with self._config_lock:
+                self._rt.event_history.append(event)
     
-    async def _send_appropriate_notification(self, analysis_result: AnalysisResult, judgment_result: JudgmentResult):
+    def _queue_event_record(self, event: MonitoringEvent) -> bool:
+        """Buffer an event for the session manager; return True when a batch is due"""
+        with self._pending_events_lock:
+            self._pending_events.append(event)
+            return self._events_batch_due_locked()
+    
+    def _events_batch_due_locked(self) -> bool:
+        """Whether pending events should be flushed (caller holds _pending_events_lock)"""
+        return len(self._pending_events) >= EVENT_BATCH_SIZE or (
+            time.monotonic() - self._events_flushed_at >= EVENT_BATCH_INTERVAL
+        )
+    
+    def _flush_event_records(self, force: bool = False):
+        """Write pending events to the session manager in a single batch"""
+        with self._pending_events_lock:
+            pending = self._pending_events
+            if not pending or not (force or self._events_batch_due_locked()):
+                return
+            object.__setattr__(self, '_pending_events', [])
+            object.__setattr__(self, '_events_flushed_at', time.monotonic())
+        
+        try:
+            self.session_manager.record_events_batch([_event_record_data(event) for event in pending])
+            # Invalidate cached recent events
+            object.__setattr__(self, '_events_cache', (0.0, None, 0, []))
+        except Exception as e:
+            logger.error(f"Error recording events: {e}")
+    
+    async def _record_events_async(self):
+        """Flush pending events on the I/O pool"""
+        await _run_io(self._flush_event_records)
+    
+    async def _send_appropriate_notification(self, analysis_result: AnalysisResult, judgment_result: JudgmentResult,
+                                             timestamp: Optional[str] = None):
         """Send appropriate notification based on analysis and judgment"""
         try:
-            if judgment_result.action == JudgmentAction.BLOCK:
+            action = judgment_result.action
+            category = analysis_result.category
+            summary = analysis_result.context_summary
+            
+            if action is _BLOCK:
                 if any(concern in ['violence', 'adult_content', 'dangerous_activities'] 
                        for concern in analysis_result.safety_concerns):
                     # Emergency notification
                     await self.notification_agent.send_emergency_notification(
-                        content_summary=analysis_result.context_summary,
+                        content_summary=summary,
                         threat_level="high",
                         additional_details={
-                            "category": analysis_result.category,
+                            "category": category,
                             "confidence": analysis_result.confidence,
                             "safety_concerns": analysis_result.safety_concerns
                         }
@@ -728,120 +1254,251 @@ class MonitoringAgent(weave.Model):
                     await self.notification_agent.send_notification(
                         template_id="content_blocked",
                         variables={
-                            "child_name": self.config.notification_config.child_name,
-                            "content_summary": analysis_result.context_summary,
-                            "category": analysis_result.category,
+                            "child_name": self._child_name,
+                            "content_summary": summary,
+                            "category": category,
                             "reason": judgment_result.reasoning,
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                            "timestamp": timestamp or _fmt_now()
                         }
                     )
             
-            elif judgment_result.action == JudgmentAction.RESTRICT:
+            elif action is _RESTRICT:
                 # Inappropriate content notification
                 await self.notification_agent.send_notification(
                     template_id="inappropriate_content",
                     variables={
-                        "child_name": self.config.notification_config.child_name,
-                        "content_summary": analysis_result.context_summary,
-                        "category": analysis_result.category,
-                        "confidence": f"{analysis_result.confidence:.1%}",
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        "child_name": self._child_name,
+                        "content_summary": summary,
+                        "category": category,
+                        "confidence": analysis_result.confidence_pct,
+                        "timestamp": timestamp or _fmt_now()
                     }
                 )
             
         except Exception as e:
             logger.error(f"Error sending notification: {e}")
     
-    @weave.op()
+    def _record_stats(self, **increments):
+        """Accumulate statistics increments, flushing them at most once per interval"""
+        with self._stats_lock:
+            self._stats_local.update(increments)
+            if time.monotonic() - self._stats_flushed_at >= STATS_FLUSH_INTERVAL:
+                self._flush_stats_locked()
+    
+    def _flush_stats_locked(self):
+        """Fold pending increments into statistics (caller holds _stats_lock)"""
+        if self._stats_local:
+            statistics = self._rt.statistics
+            for key, value in self._stats_local.items():
+                statistics[key] += value
+            self._stats_local.clear()
+        object.__setattr__(self, '_stats_flushed_at', time.monotonic())
+    
+    def _statistics_snapshot(self) -> Dict[str, Any]:
+        """Flush pending increments and return a stable copy of the statistics"""
+        with self._stats_lock:
+            self._flush_stats_locked()
+            snapshot = dict(self._rt.statistics)
+        # Derived on read from the running sums and count
+        count = snapshot['total_events']
+        if count:
+            mean = snapshot['total_processing_time'] / count
+            snapshot['average_processing_time'] = mean
+            snapshot['processing_time_std'] = math.sqrt(
+                max(snapshot['total_processing_time_sq'] / count - mean * mean, 0.0)
+            )
+        return snapshot
+    
+    def _start_notification_consumer(self):
+        """Start the notification consumer on the running loop"""
+        notif_queue = asyncio.Queue()
+        object.__setattr__(self, '_notif_queue', notif_queue)
+        object.__setattr__(self, '_notif_task', asyncio.create_task(
+            self._notification_consumer(notif_queue)
+        ))
+    
+    def _notification_queue(self) -> Optional[asyncio.Queue]:
+        """Return the notification queue if its consumer is running on the current loop"""
+        task = self._notif_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return self._notif_queue
+    
+    async def _notification_consumer(self, notif_queue: asyncio.Queue):
+        """Deliver queued notifications, coalescing those that arrive within a short window"""
+        while True:
+            batch = [await notif_queue.get()]
+            await asyncio.sleep(NOTIFICATION_BATCH_WINDOW)
+            while len(batch) < NOTIFICATION_BATCH_MAX:
+                try:
+                    batch.append(notif_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            results = await asyncio.gather(
+                *(self._send_appropriate_notification(analysis_result, judgment_result)
+                  for analysis_result, judgment_result in batch),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error sending notification: {result}")
+            for _ in batch:
+                notif_queue.task_done()
+    
+    async def _drain_notifications(self):
+        """Wait for queued notifications to be delivered, then stop the consumer"""
+        task = self._notif_task
+        if task is None:
+            return
+        notif_queue = self._notif_queue
+        object.__setattr__(self, '_notif_task', None)
+        object.__setattr__(self, '_notif_queue', None)
+        if not task.done() and task.get_loop() is asyncio.get_running_loop():
+            try:
+                await asyncio.wait_for(notif_queue.join(), timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning("Timed out delivering queued notifications")
+            task.cancel()
+            return
+        
+        # The consumer belongs to another loop; stop it and deliver what it left here
+        if not task.done():
+            task.get_loop().call_soon_threadsafe(task.cancel)
+        while True:
+            try:
+                analysis_result, judgment_result = notif_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            try:
+                await self._send_appropriate_notification(analysis_result, judgment_result)
+            except Exception as e:
+                logger.error(f"Error sending notification: {e}")
+    
     def get_monitoring_status(self) -> Dict[str, Any]:
         """Get current monitoring status and statistics"""
+        if self.config.enable_tracing:
+            return self._traced_get_monitoring_status()
+        return self._get_monitoring_status_impl()
+    
+    def get_monitoring_status_bytes(self) -> bytes:
+        """Get current monitoring status pre-serialized as JSON bytes"""
+        return _dumps(self._get_monitoring_status_impl())
+    
+    @weave.op()
+    def _traced_get_monitoring_status(self) -> Dict[str, Any]:
+        """Traced variant of get_monitoring_status"""
+        return self._get_monitoring_status_impl()
+    
+    def _get_monitoring_status_impl(self) -> Dict[str, Any]:
+        """Build the monitoring status response"""
+        now_iso = _iso_now()
         return {
-            "status": self.status.value,
-            "session_id": self.session_id,
-            "statistics": self.statistics,
-            "config": {
-                "age_group": self.config.age_group,
-                "strictness_level": self.config.strictness_level,
-                "enable_notifications": self.config.enable_notifications,
-                "screenshot_on_input": self.config.screenshot_on_input,
-                "cache_enabled": self.config.cache_enabled
-            },
-            "recent_events": len(self.event_history),
-            "timestamp": datetime.now().isoformat()
+            "status": self._rt.status.value,
+            "session_id": self._rt.session_id,
+            "statistics": self._statistics_snapshot(),
+            "config": self._config_view,
+            "recent_events": len(self._rt.event_history),
+            "timestamp": now_iso
         }
     
-    @weave.op()
     def get_recent_events(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent monitoring events"""
-        # Get events from session manager for better persistence
-        if self.session_id:
+        if self.config.enable_tracing:
+            return self._traced_get_recent_events(limit)
+        return self._get_recent_events_impl(limit)
+    
+    @weave.op()
+    def _traced_get_recent_events(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Traced variant of get_recent_events"""
+        return self._get_recent_events_impl(limit)
+    
+    def _get_recent_events_impl(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Collect recent events from the session manager or local history"""
+        if limit <= 0:
+            return []
+        
+        # Get events from session manager for better persistence, unless it failed recently
+        if self._rt.session_id and time.monotonic() >= self._session_mgr_breaker["fail_until"]:
+            # Events are append-only, so a result fetched moments ago is fresh enough for polling callers
+            now = time.monotonic()
+            fetched_at, cached_session, cached_limit, cached = self._events_cache
+            if cached_session == self._rt.session_id and cached_limit >= limit and now - fetched_at < EVENTS_CACHE_TTL:
+                return cached[:limit]
+            
             try:
                 events = self.session_manager.get_recent_events(limit)
-                return [
-                    {
-                        "timestamp": event.timestamp.isoformat(),
-                        "event_type": event.event_type,
-                        "input_text": event.input_text[:100] + "..." if len(event.input_text) > 100 else event.input_text,
-                        "category": event.analysis_category,
-                        "action": event.judgment_action,
-                        "notification_sent": event.notification_sent,
-                        "processing_time": event.processing_time,
-                        "error": event.error
-                    }
-                    for event in events
-                ]
+                # islice stops building dicts once limit is reached, even if the store returns more
+                result = list(islice(map(_record_to_dict, events), limit))
+                object.__setattr__(self, '_events_cache', (now, self._rt.session_id, limit, result))
+                return result
             except Exception as e:
                 logger.error(f"Error getting events from session manager: {e}")
+                # Skip the session manager for a while instead of failing on every poll
+                self._session_mgr_breaker["fail_until"] = time.monotonic() + SESSION_MANAGER_RETRY_DELAY
         
-        # Fallback to local event history
-        events = sorted(self.event_history, key=lambda x: x.timestamp, reverse=True)[:limit]
-        
-        return [
-            {
-                "timestamp": event.timestamp.isoformat(),
-                "event_type": event.event_type,
-                "input_text": event.input_text[:100] + "..." if len(event.input_text) > 100 else event.input_text,
-                "category": event.analysis_result.category if event.analysis_result else None,
-                "action": event.judgment_result.action.value if event.judgment_result else None,
-                "notification_sent": event.notification_sent,
-                "processing_time": event.processing_time,
-                "error": event.error
-            }
-            for event in events
-        ]
+        # Fallback to local event history (appended in processing order, newest last)
+        with self._config_lock:
+            events = list(islice(reversed(self._rt.event_history), limit))
+        return list(map(MonitoringEvent.as_dict, events))
     
-    @weave.op()
     def configure_monitoring(self, **config_updates) -> Dict[str, Any]:
         """Update monitoring configuration"""
+        if self.config.enable_tracing:
+            return self._traced_configure_monitoring(**config_updates)
+        return self._configure_monitoring_impl(**config_updates)
+    
+    @weave.op()
+    def _traced_configure_monitoring(self, **config_updates) -> Dict[str, Any]:
+        """Traced variant of configure_monitoring"""
+        return self._configure_monitoring_impl(**config_updates)
+    
+    def _configure_monitoring_impl(self, **config_updates) -> Dict[str, Any]:
+        """Apply configuration updates to the agent and its components"""
+        now_iso = _iso_now()
         try:
-            # Update configuration
-            for key, value in config_updates.items():
-                if hasattr(self.config, key):
-                    setattr(self.config, key, value)
-                    
-                    # Update component configurations
-                    if key in ['age_group', 'strictness_level']:
-                        self.analysis_agent.configure_settings(
-                            self.config.age_group,
-                            self.config.strictness_level
-                        )
-                        self.judgment_engine.configure_judgment_settings(
-                            age_group=self.config.age_group,
-                            strictness_level=self.config.strictness_level
-                        )
-                else:
-                    logger.warning(f"Unknown configuration key: {key}")
+            # Serialized with the event path's reads of config-dependent state
+            with self._config_lock:
+                # Update configuration
+                dirty = set()
+                for key, value in config_updates.items():
+                    setter = _CONFIG_SETTERS.get(key)
+                    if setter is not None:
+                        setter(self.config, value)
+                        dirty.add(key)
+                    else:
+                        logger.warning(f"Unknown configuration key: {key}")
+                
+                # Publish a new view (copy-on-write) so previously returned responses stay stable
+                if not dirty.isdisjoint(self._config_view):
+                    config_view = dict(self._config_view)
+                    for key in dirty.intersection(config_view):
+                        config_view[key] = getattr(self.config, key)
+                    object.__setattr__(self, '_config_view', config_view)
+                
+                if 'max_events' in dirty:
+                    self._rt.event_history = deque(
+                        self._rt.event_history, maxlen=self.config.max_events or EVENT_HISTORY_LIMIT
+                    )
+                
+                if 'notification_config' in dirty:
+                    object.__setattr__(self, '_child_name', self.config.notification_config.child_name)
+                
+                # Update component configurations once, even if both keys changed
+                if dirty & _COMPONENT_CONFIG_KEYS:
+                    self._reconfigure_age_group_strictness()
+                
+                if dirty & _PIPELINE_CONFIG_KEYS:
+                    self._build_pipeline()
+            
+            # Stop serving (or start rebuilding) semantic cache entries
+            if 'cache_enabled' in dirty:
+                self._close_semantic_cache()
             
             return {
                 "status": "success",
-                "updated_config": {
-                    "age_group": self.config.age_group,
-                    "strictness_level": self.config.strictness_level,
-                    "enable_notifications": self.config.enable_notifications,
-                    "screenshot_on_input": self.config.screenshot_on_input,
-                    "cache_enabled": self.config.cache_enabled
-                },
-                "timestamp": datetime.now().isoformat()
+                "updated_config": self._config_view,
+                "timestamp": now_iso
             }
             
         except Exception as e:
@@ -849,9 +1506,29 @@ class MonitoringAgent(weave.Model):
             return {
                 "status": "error",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso
             }
     
+    def _reconfigure_age_group_strictness(self):
+        """Push age group and strictness to the analysis agent and judgment engine"""
+        # Earlier judgments were made under the old settings (caller holds _config_lock)
+        object.__setattr__(self, '_config_generation', self._config_generation + 1)
+        object.__setattr__(self, '_last_result', None)
+        self.clear_cache()
+        self.analysis_agent.configure_settings(
+            self.config.age_group,
+            self.config.strictness_level
+        )
+        self.judgment_engine.configure_judgment_settings(
+            age_group=self.config.age_group,
+            strictness_level=self.config.strictness_level
+        )
+        self._compile_judgment()
+    
+    def _compile_judgment(self):
+        """Precompile the judgment engine's active rule set for the current settings"""
+        object.__setattr__(self, '_compiled_judge', self.judgment_engine.compile_judge())
+    
     @weave.op()
     async def process_manual_input(self, input_text: str, screenshot_path: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -864,69 +1541,208 @@ class MonitoringAgent(weave.Model):
         Returns:
             Dictionary with complete workflow results
         """
-        start_time = time.time()
-        
-        try:
-            # Step 1: Analyze content (force analysis for manual input)
-            analysis_result = await self.analysis_agent.analyze_input_context(
-                input_text, 
-                screenshot_path,
-                force_analysis=True  # Always force analysis for manual input
-            )
-            
-            # Step 2: Apply judgment
-            judgment_result = await self.judgment_engine.judge_content({
-                'input_text': input_text,
-                'category': analysis_result.category,
-                'confidence': analysis_result.confidence,
-                'age_appropriateness': analysis_result.age_appropriateness,
-                'safety_concerns': analysis_result.safety_concerns,
-                'educational_value': analysis_result.educational_value,
-                'parental_action': analysis_result.parental_action,
-                'context_summary': analysis_result.context_summary
-            })
-            
-            # Step 3: Send notification if needed
-            notification_result = None
-            if self.config.enable_notifications and judgment_result.action != JudgmentAction.ALLOW:
-                await self._send_appropriate_notification(analysis_result, judgment_result)
-                notification_result = {"status": "sent", "action": judgment_result.action.value}
-            
-            processing_time = time.time() - start_time
-            
+        # Reject inputs that cannot be analyzed meaningfully without a model round-trip
+        if not input_text or len(input_text) > self.config.max_input_length:
             return {
-                "status": "success",
+                "status": "error",
+                "error": "input_too_long" if input_text else "empty_input",
                 "input_text": input_text,
-                "analysis": {
-                    "category": analysis_result.category,
-                    "confidence": analysis_result.confidence,
-                    "safety_concerns": analysis_result.safety_concerns,
-                    "educational_value": analysis_result.educational_value,
-                    "context_summary": analysis_result.context_summary
-                },
-                "judgment": {
-                    "action": judgment_result.action.value,
-                    "confidence": judgment_result.confidence,
-                    "reasoning": judgment_result.reasoning
-                },
-                "notification": notification_result,
-                "processing_time": processing_time,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _iso_now()
             }
+        
+        try:
+            return await self._process_impl(input_text, screenshot_path)
             
         except Exception as e:
             logger.error(f"Error in manual processing: {e}")
+            self._record_stats(errors=1)
             return {
                 "status": "error",
                 "error": str(e),
                 "input_text": input_text,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _iso_now()
             }
     
-    def predict(self, **kwargs) -> Dict[str, Any]:
+    async def process_manual_input_bytes(self, input_text: str, screenshot_path: Optional[str] = None) -> bytes:
+        """Manually process input and return the response pre-serialized as JSON bytes"""
+        return _dumps(await self.process_manual_input(input_text, screenshot_path))
+    
+    def _build_pipeline(self):
+        """Specialize the manual-input pipeline for the current cache/notification settings"""
+        analyze = self._analyze_manual_cached if self.config.cache_enabled else self._analyze_manual
+        build_response = self._build_manual_response
+        record_stats = self._record_stats
+        
+        if self.config.enable_notifications:
+            deliver_notification = self._deliver_manual_notification
+            
+            async def process(input_text: str, screenshot_path: Optional[str]) -> Dict[str, Any]:
+                start_time = time.perf_counter()
+                analysis_result, judgment_result = await analyze(input_text, screenshot_path)
+                notification_result = await deliver_notification(analysis_result, judgment_result)
+                processing_time = time.perf_counter() - start_time
+                record_stats(
+                    total_events=1,
+                    inputs_processed=1,
+                    total_processing_time=processing_time,
+                    total_processing_time_sq=processing_time * processing_time
+                )
+                return build_response(
+                    input_text, analysis_result, judgment_result,
+                    notification_result, processing_time
+                )
+        else:
+            async def process(input_text: str, screenshot_path: Optional[str]) -> Dict[str, Any]:
+                start_time = time.perf_counter()
+                analysis_result, judgment_result = await analyze(input_text, screenshot_path)
+                processing_time = time.perf_counter() - start_time
+                record_stats(
+                    total_events=1,
+                    inputs_processed=1,
+                    total_processing_time=processing_time,
+                    total_processing_time_sq=processing_time * processing_time
+                )
+                return build_response(
+                    input_text, analysis_result, judgment_result,
+                    None, processing_time
+                )
+        
+        object.__setattr__(self, '_process_impl', process)
+    
+    async def _analyze_manual(self,
+                              input_text: str,
+                              screenshot_path: Optional[str]) -> Tuple[AnalysisResult, JudgmentResult]:
+        """Analyze manual input and apply judgment"""
+        # Force analysis for manual input
+        analysis_result = await self.analysis_agent.analyze_input_context(
+            input_text,
+            screenshot_path,
+            force_analysis=True
+        )
+        judgment_result = self._compiled_judge(_judgment_input(input_text, analysis_result))
+        return analysis_result, judgment_result
+    
+    async def _analyze_manual_cached(self,
+                                     input_text: str,
+                                     screenshot_path: Optional[str]) -> Tuple[AnalysisResult, JudgmentResult]:
+        """Analyze manual input, serving repeated prompts from the manual cache"""
+        cache_key = _manual_cache_key(
+            input_text, screenshot_path, self.config.age_group, self.config.strictness_level
+        )
+        cached_results = self._get_cached_manual_result(cache_key)
+        if cached_results is not None:
+            self._record_stats(cache_hits=1)
+            return cached_results
+        
+        results = await self._analyze_manual(input_text, screenshot_path)
+        self._store_manual_result(cache_key, results)
+        return results
+    
+    async def _deliver_manual_notification(self,
+                                           analysis_result: AnalysisResult,
+                                           judgment_result: JudgmentResult) -> Optional[Dict[str, Any]]:
+        """Notify for a non-allowed judgment: queued while monitoring runs on this loop, inline otherwise"""
+        if judgment_result.action is _ALLOW:
+            return None
+        notif_queue = self._notification_queue()
+        if notif_queue is not None:
+            # Delivery does not block the response
+            notif_queue.put_nowait((analysis_result, judgment_result))
+            return {"status": "queued", "action": judgment_result.action.value}
+        # No consumer would drain a queue here, so deliver before returning
+        await self._send_appropriate_notification(analysis_result, judgment_result)
+        return {"status": "sent", "action": judgment_result.action.value}
+    
+    def _get_cached_manual_result(self, cache_key: str) -> Optional[Tuple[AnalysisResult, JudgmentResult]]:
+        """Return a cached manual-input result that is still within cache_ttl"""
+        with self._config_lock:
+            entry = self._manual_cache.get(cache_key)
+            if entry is None:
+                return None
+            stored_at, results = entry
+            if time.monotonic() - stored_at > self.config.cache_ttl:
+                self._manual_cache.pop(cache_key, None)
+                return None
+            self._manual_cache.move_to_end(cache_key)
+            return results
+    
+    def _store_manual_result(self, cache_key: str, results: Tuple[AnalysisResult, JudgmentResult]):
+        """Cache a manual-input result, evicting the least recently used entry when full"""
+        with self._config_lock:
+            self._manual_cache[cache_key] = (time.monotonic(), results)
+            self._manual_cache.move_to_end(cache_key)
+            if len(self._manual_cache) > MANUAL_CACHE_MAXSIZE:
+                self._manual_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Drop all cached manual-input results"""
+        with self._config_lock:
+            self._manual_cache.clear()
+    
+    def _build_manual_response(self,
+                               input_text: str,
+                               analysis_result: AnalysisResult,
+                               judgment_result: JudgmentResult,
+                               notification_result: Optional[Dict[str, Any]],
+                               processing_time: float) -> Dict[str, Any]:
+        """Build the process_manual_input success response"""
+        return {
+            "status": "success",
+            "input_text": input_text,
+            "analysis": {
+                "category": analysis_result.category,
+                "confidence": analysis_result.confidence,
+                "safety_concerns": analysis_result.safety_concerns,
+                "educational_value": analysis_result.educational_value,
+                "context_summary": analysis_result.context_summary
+            },
+            "judgment": {
+                "action": judgment_result.action.value,
+                "confidence": judgment_result.confidence,
+                "reasoning": judgment_result.reasoning
+            },
+            "notification": notification_result,
+            "processing_time": processing_time,
+            "timestamp": _fast_iso(time.time())
+        }
+    
+    def predict(self, **kwargs) -> Union[Dict[str, Any], bytes]:
         """Weave Model compatibility method"""
-        return self.get_monitoring_status()
+        # Callers that accept bytes skip the dict -> JSON round-trip
+        if kwargs.get('as_bytes'):
+            return self.get_monitoring_status_bytes()
+        # Call the untraced implementation directly to avoid a nested span
+        return self._get_monitoring_status_impl()
+
+
+# Small dedicated pool for the synchronous status/events/config calls, so tool
+# traffic neither spawns threads on demand nor competes for the default executor
+_tool_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="mon-tool")
+
+# Argument schemas for the ADK tools that take arguments
+class RecentEventsArgs(TypedDict, total=False):
+    limit: int
+
+class ConfigureMonitoringArgs(TypedDict, total=False):
+    config_updates: Dict[str, Any]
+
+class ManualInputArgs(TypedDict, total=False):
+    input_text: str
+    screenshot_path: Optional[str]
 
+def _make_extractor(schema: type, **defaults: Any) -> Callable[[Any], Tuple[Any, ...]]:
+    """Build a tool-context argument extractor for a schema, with its defaults captured"""
+    if defaults.keys() != schema.__annotations__.keys():
+        raise ValueError(f"Defaults for {schema.__name__} must cover exactly its fields")
+    spec = tuple(defaults.items())
+    def extract(context: Any) -> Tuple[Any, ...]:
+        return tuple([getattr(context, name, default) for name, default in spec])
+    return extract
+
+# Precompiled argument extractors, unpacked once at each tool boundary
+_get_recent_events_args = _make_extractor(RecentEventsArgs, limit=10)
+_configure_monitoring_args = _make_extractor(ConfigureMonitoringArgs, config_updates={})
+_process_manual_input_args = _make_extractor(ManualInputArgs, input_text='', screenshot_path=None)
 
 # ADK Function Tool implementations
 async def start_monitoring_tool(context) -> Dict[str, Any]:
@@ -939,57 +1755,70 @@ async def stop_monitoring_tool(context) -> Dict[str, Any]:
     agent = get_global_monitoring_agent()
     return await agent.stop_monitoring()
 
-def get_monitoring_status_tool(context) -> Dict[str, Any]:
+async def get_monitoring_status_tool(context) -> Dict[str, Any]:
     """ADK tool to get monitoring status"""
     agent = get_global_monitoring_agent()
-    return agent.get_monitoring_status()
+    return await asyncio.get_running_loop().run_in_executor(
+        _tool_executor, agent.get_monitoring_status
+    )
 
-def get_recent_events_tool(context) -> List[Dict[str, Any]]:
+async def get_recent_events_tool(context) -> List[Dict[str, Any]]:
     """ADK tool to get recent events"""
     agent = get_global_monitoring_agent()
-    limit = getattr(context, 'limit', 10)
-    return agent.get_recent_events(limit)
+    limit, = _get_recent_events_args(context)
+    return await asyncio.get_running_loop().run_in_executor(
+        _tool_executor, agent.get_recent_events, limit
+    )
 
-def configure_monitoring_tool(context) -> Dict[str, Any]:
+async def configure_monitoring_tool(context) -> Dict[str, Any]:
     """ADK tool to configure monitoring"""
     agent = get_global_monitoring_agent()
-    config_updates = getattr(context, 'config_updates', {})
-    return agent.configure_monitoring(**config_updates)
+    config_updates, = _configure_monitoring_args(context)
+    return await asyncio.get_running_loop().run_in_executor(
+        _tool_executor, functools.partial(agent.configure_monitoring, **config_updates)
+    )
 
 async def process_manual_input_tool(context) -> Dict[str, Any]:
     """ADK tool to manually process input"""
     agent = get_global_monitoring_agent()
-    input_text = getattr(context, 'input_text', '')
-    screenshot_path = getattr(context, 'screenshot_path', None)
+    input_text, screenshot_path = _process_manual_input_args(context)
     return await agent.process_manual_input(input_text, screenshot_path)
 
-# Create ADK Function Tools
-start_monitoring_function_tool = FunctionTool(func=start_monitoring_tool)
-stop_monitoring_function_tool = FunctionTool(func=stop_monitoring_tool)
-get_monitoring_status_function_tool = FunctionTool(func=get_monitoring_status_tool)
-get_recent_events_function_tool = FunctionTool(func=get_recent_events_tool)
-configure_monitoring_function_tool = FunctionTool(func=configure_monitoring_tool)
-process_manual_input_function_tool = FunctionTool(func=process_manual_input_tool)
+# Create ADK Function Tools on first use (library users of MonitoringAgent never pay for them)
+@functools.lru_cache(maxsize=None)
+def get_monitoring_function_tools() -> Tuple[FunctionTool, ...]:
+    """Get the monitoring agent's ADK function tools, constructing them once"""
+    return (
+        FunctionTool(func=start_monitoring_tool),
+        FunctionTool(func=stop_monitoring_tool),
+        FunctionTool(func=get_monitoring_status_tool),
+        FunctionTool(func=get_recent_events_tool),
+        FunctionTool(func=configure_monitoring_tool),
+        FunctionTool(func=process_manual_input_tool)
+    )
 
 # Global monitoring agent instance
-_global_monitoring_agent = None
+_global_monitoring_agent: Optional[MonitoringAgent] = None
+_global_monitoring_agent_lock: Final = threading.Lock()
 
 def get_global_monitoring_agent() -> MonitoringAgent:
     """Get or create global monitoring agent instance"""
     global _global_monitoring_agent
-    if _global_monitoring_agent is None:
-        _global_monitoring_agent = MonitoringAgent()
-    return _global_monitoring_agent
-
-# Create complete monitoring agent for ADK
-def create_monitoring_agent() -> Agent:
-    """Create a complete Monitoring Agent for parental control system"""
+    # Fast path: no lock once the agent exists
+    agent = _global_monitoring_agent
+    if agent is not None:
+        return agent
     
-    return Agent(
-        name="MonitoringAgent",
-        model="gemini-1.5-flash",
-        description="A comprehensive monitoring agent that orchestrates all parental control components",
-        instruction="""
+    with _global_monitoring_agent_lock:
+        if _global_monitoring_agent is None:
+            _global_monitoring_agent = MonitoringAgent()
+        return _global_monitoring_agent
+
+_MONITORING_AGENT_DESCRIPTION: Final[str] = (
+    "A comprehensive monitoring agent that orchestrates all parental control components"
+)
+
+_MONITORING_AGENT_INSTRUCTION: Final[str] = """
         You are the main orchestrating agent for a comprehensive parental control system.
         
         Your capabilities include:
@@ -1025,15 +1854,17 @@ def create_monitoring_agent() -> Agent:
         
         Always prioritize child safety while maintaining age-appropriate freedom.
         Provide clear status updates and handle errors gracefully.
-        """,
-        tools=[
-            start_monitoring_function_tool,
-            stop_monitoring_function_tool,
-            get_monitoring_status_function_tool,
-            get_recent_events_function_tool,
-            configure_monitoring_function_tool,
-            process_manual_input_function_tool
-        ]
+        """
+
+# Create complete monitoring agent for ADK
+def create_monitoring_agent() -> Agent:
+    """Create a complete Monitoring Agent for parental control system"""
+    return Agent(
+        name="MonitoringAgent",
+        model="gemini-1.5-flash",
+        description=_MONITORING_AGENT_DESCRIPTION,
+        instruction=_MONITORING_AGENT_INSTRUCTION,
+        tools=list(get_monitoring_function_tools())
     )
 
 # Export main classes
@@ -1042,12 +1873,7 @@ __all__ = [
     "MonitoringConfig",
     "MonitoringStatus",
     "MonitoringEvent",
-    "start_monitoring_function_tool",
-    "stop_monitoring_function_tool",
-    "get_monitoring_status_function_tool",
-    "get_recent_events_function_tool",
-    "configure_monitoring_function_tool",
-    "process_manual_input_function_tool",
+    "get_monitoring_function_tools",
     "create_monitoring_agent",
     "get_global_monitoring_agent"
 ] 
\ No newline at end of file
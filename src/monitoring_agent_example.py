@@ -10,6 +10,12 @@ import sys
 import os
 from datetime import datetime
 
+# uvloop is optional (and unavailable on Windows); fall back to the default asyncio loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
 
@@ -21,10 +27,13 @@ from monitoring_agent import (
 )
 from notification_agent import NotificationConfig
 
+def _write(*lines: str):
+    """Write a block of output lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 async def main():
     """Main example function"""
-    print("🚀 MonitoringAgent Usage Example")
-    print("=" * 50)
+    _write("🚀 MonitoringAgent Usage Example", "=" * 50)
     
     # Step 1: Create configuration
     config = MonitoringConfig(
@@ -44,16 +53,17 @@ async def main():
     
     # Step 2: Create monitoring agent
     agent = MonitoringAgent(config=config)
-    print("✅ MonitoringAgent created")
     
     # Step 3: Check initial status
     status = agent.get_monitoring_status()
-    print(f"📊 Initial status: {status['status']}")
-    print(f"📋 Configuration: {status['config']['age_group']}, {status['config']['strictness_level']}")
+    _write(
+        "✅ MonitoringAgent created",
+        f"📊 Initial status: {status['status']}",
+        f"📋 Configuration: {status['config']['age_group']}, {status['config']['strictness_level']}",
+        "\n🔍 Processing example inputs..."
+    )
     
     # Step 4: Process some example inputs
-    print("\n🔍 Processing example inputs...")
-    
     test_inputs = [
         "What is photosynthesis?",
         "How to study for math test",
@@ -61,61 +71,84 @@ async def main():
         "Science homework help"
     ]
     
-    for i, input_text in enumerate(test_inputs, 1):
-        print(f"\n   Example {i}: {input_text}")
-        
-        result = await agent.process_manual_input(input_text, None)
-        
-        if result["status"] == "success":
-            print(f"     ✅ Category: {result['analysis']['category']}")
-            print(f"     ✅ Action: {result['judgment']['action']}")
-            print(f"     ✅ Confidence: {result['analysis']['confidence']:.1%}")
-            print(f"     ✅ Processing time: {result['processing_time']:.3f}s")
+    # The inputs are independent, so overlap their analysis round-trips
+    results = await asyncio.gather(
+        *(agent.process_manual_input(input_text, None) for input_text in test_inputs),
+        return_exceptions=True
+    )
+    
+    for i, (input_text, result) in enumerate(zip(test_inputs, results), 1):
+        lines = [f"\n   Example {i}: {input_text}"]
+        if isinstance(result, Exception):
+            lines.append(f"     ❌ Error: {result}")
+        elif result["status"] == "success":
+            lines += [
+                f"     ✅ Category: {result['analysis']['category']}",
+                f"     ✅ Action: {result['judgment']['action']}",
+                f"     ✅ Confidence: {result['analysis']['confidence']:.1%}",
+                f"     ✅ Processing time: {result['processing_time']:.3f}s"
+            ]
             
             if result.get('notification'):
-                print(f"     📢 Notification: {result['notification']['status']}")
+                lines.append(f"     📢 Notification: {result['notification']['status']}")
         else:
-            print(f"     ❌ Error: {result.get('error', 'Unknown error')}")
+            lines.append(f"     ❌ Error: {result.get('error', 'Unknown error')}")
+        _write(*lines)
     
     # Step 5: Check statistics
-    print("\n📊 Final Statistics:")
     final_status = agent.get_monitoring_status()
     stats = final_status["statistics"]
     
-    print(f"   Total events: {stats['total_events']}")
-    print(f"   Inputs processed: {stats['inputs_processed']}")
-    print(f"   Average processing time: {stats['average_processing_time']:.3f}s")
-    print(f"   Errors: {stats['errors']}")
-    
     # Step 6: Get recent events
-    print("\n📋 Recent Events:")
     recent_events = agent.get_recent_events(limit=3)
     
+    lines = [
+        "\n📊 Final Statistics:",
+        f"   Total events: {stats['total_events']}",
+        f"   Inputs processed: {stats['inputs_processed']}",
+        f"   Average processing time: {stats['average_processing_time']:.3f}s",
+        f"   Errors: {stats['errors']}",
+        "\n📋 Recent Events:"
+    ]
     for event in recent_events:
-        print(f"   {event['timestamp']}: {event['input_text'][:50]}...")
-        print(f"     Category: {event['category']}, Action: {event['action']}")
+        lines += [
+            f"   {event['timestamp']}: {event['input_text'][:50]}...",
+            f"     Category: {event['category']}, Action: {event['action']}"
+        ]
+    _write(*lines)
     
     # Step 7: Configuration update example
-    print("\n⚙️ Configuration Update Example:")
     update_result = agent.configure_monitoring(
         age_group="middle_school",
         strictness_level="strict"
     )
     
+    lines = ["\n⚙️ Configuration Update Example:"]
     if update_result["status"] == "success":
-        print("   ✅ Configuration updated successfully")
-        print(f"   New settings: {update_result['updated_config']['age_group']}, {update_result['updated_config']['strictness_level']}")
+        lines += [
+            "   ✅ Configuration updated successfully",
+            f"   New settings: {update_result['updated_config']['age_group']}, {update_result['updated_config']['strictness_level']}"
+        ]
     
-    print("\n🎉 MonitoringAgent example completed!")
-    print("\n📖 Key Features Demonstrated:")
-    print("   ✅ Agent initialization and configuration")
-    print("   ✅ Manual input processing")
-    print("   ✅ Analysis and judgment workflow")
-    print("   ✅ Statistics and monitoring")
-    print("   ✅ Event history tracking")
-    print("   ✅ Runtime configuration updates")
-    
-    print("\n🔧 AGT-001 (Basic Agent Architecture) - FULLY OPERATIONAL")
+    lines += [
+        "\n🎉 MonitoringAgent example completed!",
+        "\n📖 Key Features Demonstrated:",
+        "   ✅ Agent initialization and configuration",
+        "   ✅ Manual input processing",
+        "   ✅ Analysis and judgment workflow",
+        "   ✅ Statistics and monitoring",
+        "   ✅ Event history tracking",
+        "   ✅ Runtime configuration updates",
+        "\n🔧 AGT-001 (Basic Agent Architecture) - FULLY OPERATIONAL"
+    ]
+    _write(*lines)
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # asyncio.Runner(loop_factory=...) needs Python 3.11; drive the loop by hand
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
@@ -13,15 +13,24 @@ import os
 import json
 import logging
 import asyncio
+import functools
+import heapq
+import itertools
+from operator import attrgetter
+import string
+import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Literal, Union
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Literal, Sequence, Union
+from dataclasses import dataclass, field, asdict
 from enum import Enum
-import smtplib
+import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import subprocess
 import platform
+import threading
+import weakref
 import weave
 from google.adk.tools import FunctionTool
 
@@ -29,6 +38,105 @@ from google.adk.tools import FunctionTool
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maximum number of notification records kept in memory
+NOTIFICATION_HISTORY_LIMIT = 10_000
+
+# Window covered by the "recent" notification statistics
+RECENT_NOTIFICATION_WINDOW = timedelta(days=7)
+
+_formatter = string.Formatter()
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(template: str) -> Optional[tuple]:
+    """Parse a format template once into (literal, field, spec, conversion) pieces"""
+    pieces = tuple(_formatter.parse(template))
+    # Attribute/index lookups and nested specs are left to str.format_map
+    for _, field_name, format_spec, _ in pieces:
+        if field_name is not None and (not field_name.isidentifier() or '{' in format_spec):
+            return None
+    return pieces
+
+def _parse_hhmm(value: str) -> int:
+    """Convert an "HH:MM" string to minutes since midnight"""
+    hours, minutes = map(int, value.split(":"))
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError(f"Invalid time of day: {value}")
+    return hours * 60 + minutes
+
+_weave_initialized = False
+_weave_init_lock = threading.Lock()
+
+def _init_weave():
+    """Initialize Weave tracking once per process"""
+    global _weave_initialized
+    with _weave_init_lock:
+        if _weave_initialized:
+            return
+        # Mark the attempt up front so a failing init isn't retried per agent
+        _weave_initialized = True
+        try:
+            weave.init("parental-control-notifications")
+            #logger.info("Weave tracking initialized for notifications")
+        except Exception as e:
+            logger.warning(f"Weave initialization failed: {e}")
+
+_BY_TIMESTAMP = attrgetter('timestamp')
+
+# Host platform, resolved once at import
+_SYSTEM = platform.system()
+
+# Escapes for text embedded in an AppleScript string literal
+_APPLESCRIPT_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r'})
+
+async def _run_notifier(args: List[str]):
+    """Run a desktop notifier command on a worker thread, off the event loop"""
+    # asyncio.to_thread needs Python 3.9
+    await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(subprocess.run, args, check=True)
+    )
+
+async def _mac_notify(subject: str, body: str) -> Optional[Dict[str, Any]]:
+    """Show a desktop notification through osascript"""
+    # Escape strings for AppleScript
+    escaped_body = body.translate(_APPLESCRIPT_ESCAPES)
+    escaped_subject = subject.translate(_APPLESCRIPT_ESCAPES)
+    
+    script = f'''
+    display notification "{escaped_body}" with title "{escaped_subject}" sound name "Glass"
+    '''
+    await _run_notifier(["osascript", "-e", script])
+    return None
+
+async def _linux_notify(subject: str, body: str) -> Optional[Dict[str, Any]]:
+    """Show a desktop notification through notify-send"""
+    await _run_notifier(["notify-send", subject, body])
+    return None
+
+@functools.lru_cache(maxsize=None)
+def _get_toaster():
+    """Create the Windows toast notifier once"""
+    import win10toast
+    return win10toast.ToastNotifier()
+
+async def _win_notify(subject: str, body: str) -> Optional[Dict[str, Any]]:
+    """Show a Windows toast notification"""
+    try:
+        toaster = _get_toaster()
+    except ImportError:
+        logger.warning("win10toast not available, using fallback")
+        return {"success": False, "error": "Windows notifications not available"}
+    # show_toast blocks for the toast duration
+    await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(toaster.show_toast, subject, body, duration=10)
+    )
+    return None
+
+_DESKTOP_BACKENDS = {
+    "Darwin": _mac_notify,
+    "Linux": _linux_notify,
+    "Windows": _win_notify,
+}
+
 class NotificationPriority(Enum):
     """Notification priority levels"""
     LOW = "low"
@@ -51,6 +159,18 @@ class NotificationStatus(Enum):
     FAILED = "failed"
     READ = "read"
 
+# Enum lookup tables built once; dict access avoids Enum.__call__ on the send path
+_PRIORITY_BY_STR = {p.value: p for p in NotificationPriority}
+_CHANNEL_BY_STR = {c.value: c for c in NotificationChannel}
+_CHANNEL_VALUE = {c: c.value for c in NotificationChannel}
+
+# Emergency alert content, shared by the template table and the emergency fast path
+_EMERGENCY_SUBJECT = "EMERGENCY ALERT - {child_name}"
+_EMERGENCY_BODY = "IMMEDIATE ATTENTION REQUIRED\n\nYour child {child_name} has encountered potentially dangerous content:\n\nContent: {content_summary}\nThreat Level: {threat_level}\nTime: {timestamp}\n\nPlease check on your child immediately."
+_EMERGENCY_CHILD_MESSAGE = "This content contains serious safety concerns. Please speak with your parents immediately."
+_EMERGENCY_CHANNELS = (NotificationChannel.DESKTOP, NotificationChannel.EMAIL)
+_EMERGENCY_CHANNELS_WITH_SMS = _EMERGENCY_CHANNELS + (NotificationChannel.SMS,)
+
 @dataclass
 class NotificationConfig:
     """Configuration for notification preferences"""
@@ -69,6 +189,13 @@ class NotificationConfig:
         if self.emergency_channels is None:
             self.emergency_channels = ["desktop", "email"]
 
+@dataclass
+class _SmtpConnection:
+    """SMTP connection and send lock owned by one event loop"""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    smtp: Optional[aiosmtplib.SMTP] = None
+    params: Optional[tuple] = None
+
 @dataclass
 class NotificationTemplate:
     """Template for notification messages"""
@@ -102,6 +229,28 @@ class NotificationRecord:
     delivered_at: Optional[datetime] = None
     read_at: Optional[datetime] = None
     error_message: Optional[str] = None
+    _history_fields: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def as_history_dict(self) -> Dict[str, Any]:
+        """Serialize for history queries; fields fixed at creation are converted once"""
+        if self._history_fields is None:
+            self._history_fields = {
+                "id": self.id,
+                "timestamp": self.timestamp.isoformat(),
+                "priority": self.priority.value,
+                "channels": [_CHANNEL_VALUE[c] for c in self.channels],
+                "recipient": self.recipient,
+                "subject": self.subject,
+            }
+        
+        # Delivery state can change after the record is stored
+        return {
+            **self._history_fields,
+            "status": self.status.value,
+            "template_id": self.template_id,
+            "delivered_at": self.delivered_at.isoformat() if self.delivered_at else None,
+            "error_message": self.error_message
+        }
 
 class NotificationAgent(weave.Model):
     """
@@ -119,7 +268,15 @@ class NotificationAgent(weave.Model):
         
         # Use object.__setattr__ to set attributes on Pydantic model
         object.__setattr__(self, 'config', config or NotificationConfig())
-        object.__setattr__(self, 'notification_history', [])
+        # Serialized config, refreshed by configure_notifications when it changes
+        object.__setattr__(self, '_config_dict', asdict(self.config))
+        object.__setattr__(self, 'notification_history', deque(maxlen=NOTIFICATION_HISTORY_LIMIT))
+        # (timestamp, priority) of notifications inside RECENT_NOTIFICATION_WINDOW, oldest first
+        object.__setattr__(self, '_recent', deque())
+        object.__setattr__(self, '_recent_emergency', 0)
+        # Disambiguates notification IDs created within the same nanosecond tick
+        object.__setattr__(self, '_id_counter', itertools.count())
+        self._recompute_quiet_bounds()
         object.__setattr__(self, 'templates', self._load_default_templates())
         object.__setattr__(self, 'statistics', {
             "total_sent": 0,
@@ -130,12 +287,13 @@ class NotificationAgent(weave.Model):
             "failed_deliveries": 0
         })
         
+        # SMTP connection reused across sends; TLS + AUTH happen once per connection.
+        # aiosmtplib connections and asyncio locks are bound to the loop that created
+        # them, and this agent sends from several loops, so keep one per loop.
+        object.__setattr__(self, '_smtp_conns', weakref.WeakKeyDictionary())
+        
         # Initialize Weave tracking
-        try:
-            weave.init("parental-control-notifications")
-            #logger.info("Weave tracking initialized for notifications")
-        except Exception as e:
-            logger.warning(f"Weave initialization failed: {e}")
+        _init_weave()
     
     def _load_default_templates(self) -> Dict[str, NotificationTemplate]:
         """Load default notification templates"""
@@ -165,9 +323,9 @@ class NotificationAgent(weave.Model):
                 name="Emergency Alert",
                 priority=NotificationPriority.EMERGENCY,
                 channels=[NotificationChannel.DESKTOP, NotificationChannel.EMAIL, NotificationChannel.SMS],
-                subject_template="EMERGENCY ALERT - {child_name}",
-                body_template="IMMEDIATE ATTENTION REQUIRED\n\nYour child {child_name} has encountered potentially dangerous content:\n\nContent: {content_summary}\nThreat Level: {threat_level}\nTime: {timestamp}\n\nPlease check on your child immediately.",
-                child_message_template="This content contains serious safety concerns. Please speak with your parents immediately.",
+                subject_template=_EMERGENCY_SUBJECT,
+                body_template=_EMERGENCY_BODY,
+                child_message_template=_EMERGENCY_CHILD_MESSAGE,
                 variables=["child_name", "content_summary", "threat_level", "timestamp"]
             ),
             "monitoring_alert": NotificationTemplate(
@@ -189,6 +347,14 @@ class NotificationAgent(weave.Model):
                 variables=["status", "uptime", "last_check", "details"]
             )
         }
+        
+        # Parse every template up front so the first notification doesn't pay for it
+        for template in templates.values():
+            _compile_template(template.subject_template)
+            _compile_template(template.body_template)
+            if template.child_message_template:
+                _compile_template(template.child_message_template)
+        
         return templates
     
     @weave.op()
@@ -219,12 +385,12 @@ class NotificationAgent(weave.Model):
             template = self.templates[template_id]
             
             # Override priority if specified
-            priority = NotificationPriority(priority_override) if priority_override else template.priority
+            priority = _PRIORITY_BY_STR[priority_override] if priority_override else template.priority
             
             # Override channels if specified
             notification_channels = []
             if channels:
-                notification_channels = [NotificationChannel(c) for c in channels]
+                notification_channels = [_CHANNEL_BY_STR[c] for c in channels]
             else:
                 notification_channels = template.channels
             
@@ -241,73 +407,12 @@ class NotificationAgent(weave.Model):
             # Render message content
             subject = self._render_template(template.subject_template, variables)
             body = self._render_template(template.body_template, variables)
-            
-            # Create notification record
-            notification_id = f"not_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{template_id}"
-            record = NotificationRecord(
-                id=notification_id,
-                timestamp=datetime.now(),
-                priority=priority,
-                channels=notification_channels,
-                recipient=recipient,
-                subject=subject,
-                body=body,
-                status=NotificationStatus.PENDING,
-                template_id=template_id,
-                judgment_id=variables.get("judgment_id")
-            )
-            
-            # Send through each channel
-            delivery_results = {}
-            for channel in notification_channels:
-                try:
-                    if channel == NotificationChannel.DESKTOP:
-                        result = await self._send_desktop_notification(subject, body, priority)
-                    elif channel == NotificationChannel.EMAIL:
-                        result = await self._send_email_notification(subject, body, priority)
-                    elif channel == NotificationChannel.SMS:
-                        result = await self._send_sms_notification(subject, body, priority)
-                    elif channel == NotificationChannel.IN_APP:
-                        result = await self._send_in_app_notification(subject, body, priority)
-                    else:
-                        result = {"success": False, "error": f"Unknown channel: {channel}"}
-                    
-                    delivery_results[channel.value] = result
-                    
-                except Exception as e:
-                    logger.error(f"Failed to send notification via {channel.value}: {e}")
-                    delivery_results[channel.value] = {"success": False, "error": str(e)}
-            
-            # Update record status
-            successful_deliveries = sum(1 for r in delivery_results.values() if r.get("success"))
-            if successful_deliveries > 0:
-                record.status = NotificationStatus.SENT
-                record.delivered_at = datetime.now()
-            else:
-                record.status = NotificationStatus.FAILED
-                record.error_message = "All delivery channels failed"
-            
-            # Store record and update statistics
-            new_history = list(self.notification_history)
-            new_history.append(record)
-            object.__setattr__(self, 'notification_history', new_history)
-            self._update_statistics(record, successful_deliveries > 0)
-            
-            # Send child notification if applicable
-            child_result = None
+            child_message = None
             if recipient == "parent" and template.child_message_template:
                 child_message = self._render_template(template.child_message_template, variables)
-                child_result = await self._send_child_notification(child_message, priority)
             
-            return {
-                "status": "success" if successful_deliveries > 0 else "failed",
-                "notification_id": notification_id,
-                "delivery_results": delivery_results,
-                "child_notification": child_result,
-                "timestamp": record.timestamp.isoformat(),
-                "channels_attempted": len(notification_channels),
-                "channels_successful": successful_deliveries
-            }
+            return await self._deliver(template_id, subject, body, child_message, priority,
+                                       notification_channels, recipient, variables.get("judgment_id"))
             
         except Exception as e:
             logger.error(f"Error sending notification: {e}")
@@ -318,6 +423,84 @@ class NotificationAgent(weave.Model):
                 "timestamp": datetime.now().isoformat()
             }
     
+    async def _deliver(self,
+                       template_id: str,
+                       subject: str,
+                       body: str,
+                       child_message: Optional[str],
+                       priority: NotificationPriority,
+                       notification_channels: Sequence[NotificationChannel],
+                       recipient: str,
+                       judgment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Deliver rendered content on all channels, then record and report the outcome"""
+        # Create notification record
+        notification_id = f"not_{time.time_ns()}_{next(self._id_counter)}_{template_id}"
+        record = NotificationRecord(
+            id=notification_id,
+            timestamp=datetime.now(),
+            priority=priority,
+            channels=notification_channels,
+            recipient=recipient,
+            subject=subject,
+            body=body,
+            status=NotificationStatus.PENDING,
+            template_id=template_id,
+            judgment_id=judgment_id
+        )
+        
+        # Send through all channels concurrently
+        results = await asyncio.gather(
+            *(self._dispatch(channel, subject, body, priority) for channel in notification_channels),
+            return_exceptions=True
+        )
+        delivery_results = {}
+        for channel, result in zip(notification_channels, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send notification via {channel.value}: {result}")
+                result = {"success": False, "error": str(result)}
+            delivery_results[channel.value] = result
+        
+        # Update record status
+        successful_deliveries = sum(1 for r in delivery_results.values() if r.get("success"))
+        if successful_deliveries > 0:
+            record.status = NotificationStatus.SENT
+            record.delivered_at = datetime.now()
+        else:
+            record.status = NotificationStatus.FAILED
+            record.error_message = "All delivery channels failed"
+        
+        # Store record and update statistics
+        self.notification_history.append(record)
+        self._track_recent(record)
+        self._update_statistics(record, successful_deliveries > 0)
+        
+        # Send child notification if applicable
+        child_result = None
+        if child_message is not None:
+            child_result = await self._send_child_notification(child_message, priority)
+        
+        return {
+            "status": "success" if successful_deliveries > 0 else "failed",
+            "notification_id": notification_id,
+            "delivery_results": delivery_results,
+            "child_notification": child_result,
+            "timestamp": record.timestamp.isoformat(),
+            "channels_attempted": len(notification_channels),
+            "channels_successful": successful_deliveries
+        }
+    
+    async def _dispatch(self, channel: NotificationChannel, subject: str, body: str, priority: NotificationPriority) -> Dict[str, Any]:
+        """Send a notification through a single channel"""
+        if channel == NotificationChannel.DESKTOP:
+            return await self._send_desktop_notification(subject, body, priority)
+        elif channel == NotificationChannel.EMAIL:
+            return await self._send_email_notification(subject, body, priority)
+        elif channel == NotificationChannel.SMS:
+            return await self._send_sms_notification(subject, body, priority)
+        elif channel == NotificationChannel.IN_APP:
+            return await self._send_in_app_notification(subject, body, priority)
+        return {"success": False, "error": f"Unknown channel: {channel}"}
+    
     @weave.op()
     async def send_emergency_notification(self, 
                                         content_summary: str,
@@ -345,23 +528,10 @@ class NotificationAgent(weave.Model):
             if additional_details:
                 variables.update(additional_details)
             
-            # Force all emergency channels
-            emergency_channels = ["desktop", "email"]
-            if self.config.sms_notifications and self.config.parent_phone:
-                emergency_channels.append("sms")
-            
-            result = await self.send_notification(
-                template_id="emergency_alert",
-                variables=variables,
-                recipient="parent",
-                channels=emergency_channels,
-                priority_override="emergency"
-            )
+            result = await self._send_emergency_fast(variables)
             
             # Update emergency statistics
-            new_stats = dict(self.statistics)
-            new_stats["emergency_count"] += 1
-            object.__setattr__(self, 'statistics', new_stats)
+            self.statistics["emergency_count"] += 1
             
             logger.warning(f"Emergency notification sent: {content_summary}")
             
@@ -375,33 +545,32 @@ class NotificationAgent(weave.Model):
                 "timestamp": datetime.now().isoformat()
             }
     
+    async def _send_emergency_fast(self, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Render and deliver an emergency alert without the general template path"""
+        # Emergencies bypass quiet hours and always use the emergency channels
+        channels = _EMERGENCY_CHANNELS
+        if self.config.sms_notifications and self.config.parent_phone:
+            channels = _EMERGENCY_CHANNELS_WITH_SMS
+        
+        return await self._deliver(
+            "emergency_alert",
+            self._render_template(_EMERGENCY_SUBJECT, variables),
+            self._render_template(_EMERGENCY_BODY, variables),
+            _EMERGENCY_CHILD_MESSAGE,
+            NotificationPriority.EMERGENCY,
+            channels,
+            "parent",
+            variables.get("judgment_id")
+        )
+    
     async def _send_desktop_notification(self, subject: str, body: str, priority: NotificationPriority) -> Dict[str, Any]:
         """Send desktop notification"""
         try:
-            if platform.system() == "Darwin":  # macOS
-                # Escape strings for AppleScript
-                escaped_body = body.replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
-                escaped_subject = subject.replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
-                
-                # Use osascript for macOS notifications
-                script = f'''
-                display notification "{escaped_body}" with title "{escaped_subject}" sound name "Glass"
-                '''
-                subprocess.run(["osascript", "-e", script], check=True)
-                
-            elif platform.system() == "Linux":
-                # Use notify-send for Linux
-                subprocess.run(["notify-send", subject, body], check=True)
-                
-            elif platform.system() == "Windows":
-                # Use Windows toast notifications
-                try:
-                    import win10toast
-                    toaster = win10toast.ToastNotifier()
-                    toaster.show_toast(subject, body, duration=10)
-                except ImportError:
-                    logger.warning("win10toast not available, using fallback")
-                    return {"success": False, "error": "Windows notifications not available"}
+            backend = _DESKTOP_BACKENDS.get(_SYSTEM)
+            if backend is not None:
+                error = await backend(subject, body)
+                if error:
+                    return error
             
             return {"success": True, "channel": "desktop", "timestamp": datetime.now().isoformat()}
             
@@ -437,12 +606,16 @@ class NotificationAgent(weave.Model):
             
             msg.attach(MIMEText(body, 'plain'))
             
-            # Send email
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-            server.login(email_user, email_password)
-            server.send_message(msg)
-            server.quit()
+            # Send email over this loop's connection; SMTP is sequential per connection
+            params = (smtp_server, smtp_port, email_user, email_password)
+            conn = self._smtp_connection()
+            async with conn.lock:
+                try:
+                    await (await self._get_smtp(conn, params)).send_message(msg)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # Server dropped an idle connection; reconnect once and retry
+                    conn.smtp = None
+                    await (await self._get_smtp(conn, params)).send_message(msg)
             
             return {"success": True, "channel": "email", "timestamp": datetime.now().isoformat()}
             
@@ -450,6 +623,53 @@ class NotificationAgent(weave.Model):
             logger.error(f"Email notification failed: {e}")
             return {"success": False, "error": str(e)}
     
+    def _smtp_connection(self) -> _SmtpConnection:
+        """Return the SMTP connection slot for the running event loop"""
+        loop = asyncio.get_running_loop()
+        conn = self._smtp_conns.get(loop)
+        if conn is None:
+            conn = _SmtpConnection()
+            self._smtp_conns[loop] = conn
+        return conn
+    
+    async def _get_smtp(self, conn: _SmtpConnection, params: tuple) -> aiosmtplib.SMTP:
+        """Return the loop's SMTP connection, connecting and authenticating if needed (caller holds conn.lock)"""
+        smtp = conn.smtp
+        if smtp is not None and smtp.is_connected and conn.params == params:
+            return smtp
+        
+        if smtp is not None and smtp.is_connected:
+            # Server or credentials changed since the connection was opened
+            try:
+                await smtp.quit()
+            except aiosmtplib.SMTPException:
+                pass
+        
+        conn.smtp = None
+        smtp_server, smtp_port, email_user, email_password = params
+        smtp = aiosmtplib.SMTP(hostname=smtp_server, port=smtp_port, start_tls=False)
+        await smtp.connect()
+        await smtp.starttls()
+        await smtp.login(email_user, email_password)
+        
+        conn.smtp = smtp
+        conn.params = params
+        return smtp
+    
+    async def close_email_connection(self):
+        """Close the running event loop's SMTP connection, if open"""
+        conn = self._smtp_conns.pop(asyncio.get_running_loop(), None)
+        if conn is None:
+            return
+        async with conn.lock:
+            smtp = conn.smtp
+            conn.smtp = None
+            if smtp is not None and smtp.is_connected:
+                try:
+                    await smtp.quit()
+                except aiosmtplib.SMTPException as e:
+                    logger.warning(f"Error closing SMTP connection: {e}")
+    
     async def _send_sms_notification(self, subject: str, body: str, priority: NotificationPriority) -> Dict[str, Any]:
         """Send SMS notification (placeholder for SMS service integration)"""
         try:
@@ -492,14 +712,14 @@ class NotificationAgent(weave.Model):
         """Send age-appropriate notification to child"""
         try:
             # Send desktop notification to child
-            if platform.system() == "Darwin":  # macOS
+            if _SYSTEM == "Darwin":  # macOS
                 # Escape strings for AppleScript
-                escaped_message = message.replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
+                escaped_message = message.translate(_APPLESCRIPT_ESCAPES)
                 
                 script = f'''
                 display notification "{escaped_message}" with title "Digital Safety Reminder" sound name "Ping"
                 '''
-                subprocess.run(["osascript", "-e", script], check=True)
+                await _run_notifier(["osascript", "-e", script])
             
             return {"success": True, "channel": "child_desktop", "timestamp": datetime.now().isoformat()}
             
@@ -510,69 +730,104 @@ class NotificationAgent(weave.Model):
     def _render_template(self, template: str, variables: Dict[str, Any]) -> str:
         """Render template with variables"""
         try:
-            return template.format(**variables)
+            pieces = _compile_template(template)
+            if pieces is None:
+                return template.format_map(variables)
+            
+            parts = []
+            for literal, field_name, format_spec, conversion in pieces:
+                parts.append(literal)
+                if field_name is not None:
+                    value = variables[field_name]
+                    if conversion:
+                        value = _formatter.convert_field(value, conversion)
+                    parts.append(format(value, format_spec))
+            return ''.join(parts)
         except KeyError as e:
             logger.warning(f"Missing template variable: {e}")
             return template
     
+    def _recompute_quiet_bounds(self):
+        """Parse the quiet-hours window into minutes since midnight"""
+        try:
+            bounds = (_parse_hhmm(self.config.quiet_hours_start), _parse_hhmm(self.config.quiet_hours_end))
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Invalid quiet hours configuration, quiet hours disabled: {e}")
+            bounds = None
+        object.__setattr__(self, '_quiet_bounds', bounds)
+    
     def _is_quiet_hours(self) -> bool:
         """Check if current time is within quiet hours"""
-        try:
-            now = datetime.now().time()
-            start_time = datetime.strptime(self.config.quiet_hours_start, "%H:%M").time()
-            end_time = datetime.strptime(self.config.quiet_hours_end, "%H:%M").time()
-            
-            if start_time <= end_time:
-                return start_time <= now <= end_time
-            else:  # Quiet hours cross midnight
-                return now >= start_time or now <= end_time
-        except Exception:
+        if self._quiet_bounds is None:
             return False
+        
+        # Compare in seconds so the window closes at end:00, not end:59
+        start, end = self._quiet_bounds[0] * 60, self._quiet_bounds[1] * 60
+        now = datetime.now().time()
+        now_seconds = now.hour * 3600 + now.minute * 60 + now.second
+        
+        if start <= end:
+            return start <= now_seconds <= end
+        else:  # Quiet hours cross midnight
+            return now_seconds >= start or now_seconds <= end
     
     def _get_next_active_time(self) -> str:
         """Get next time when notifications can be sent"""
-        try:
-            now = datetime.now()
-            end_time = datetime.strptime(self.config.quiet_hours_end, "%H:%M").time()
-            next_active = datetime.combine(now.date(), end_time)
-            
-            if next_active <= now:
-                next_active += timedelta(days=1)
-            
-            return next_active.isoformat()
-        except Exception:
-            return (datetime.now() + timedelta(hours=1)).isoformat()
+        now = datetime.now()
+        if self._quiet_bounds is None:
+            return (now + timedelta(hours=1)).isoformat()
+        
+        end = self._quiet_bounds[1]
+        next_active = now.replace(hour=end // 60, minute=end % 60, second=0, microsecond=0)
+        
+        if next_active <= now:
+            next_active += timedelta(days=1)
+        
+        return next_active.isoformat()
     
     def _update_statistics(self, record: NotificationRecord, success: bool):
         """Update notification statistics"""
-        # Create a new statistics dict to avoid Pydantic tracking issues
-        new_stats = dict(self.statistics)
-        new_stats["total_sent"] += 1
-        new_stats["by_priority"][record.priority.value] += 1
-        new_stats["by_status"][record.status.value] += 1
+        # statistics is a plain dict set via object.__setattr__, so it is mutated in place
+        stats = self.statistics
+        stats["total_sent"] += 1
+        stats["by_priority"][record.priority.value] += 1
+        stats["by_status"][record.status.value] += 1
         
+        by_channel = stats["by_channel"]
         for channel in record.channels:
-            new_stats["by_channel"][channel.value] += 1
+            by_channel[_CHANNEL_VALUE[channel]] += 1
         
         if not success:
-            new_stats["failed_deliveries"] += 1
-        
-        # Update statistics using object.__setattr__
-        object.__setattr__(self, 'statistics', new_stats)
+            stats["failed_deliveries"] += 1
+    
+    def _track_recent(self, record: NotificationRecord):
+        """Add a notification to the rolling recent-window counters"""
+        self._recent.append((record.timestamp, record.priority))
+        if record.priority == NotificationPriority.EMERGENCY:
+            object.__setattr__(self, '_recent_emergency', self._recent_emergency + 1)
+    
+    def _evict_recent(self):
+        """Drop notifications that have aged out of the recent window"""
+        recent = self._recent
+        cutoff = datetime.now() - RECENT_NOTIFICATION_WINDOW
+        evicted_emergency = 0
+        while recent and recent[0][0] <= cutoff:
+            if recent.popleft()[1] == NotificationPriority.EMERGENCY:
+                evicted_emergency += 1
+        if evicted_emergency:
+            object.__setattr__(self, '_recent_emergency', self._recent_emergency - evicted_emergency)
     
     @weave.op()
     def get_notification_statistics(self) -> Dict[str, Any]:
         """Get notification statistics and analytics"""
-        recent_notifications = [
-            n for n in self.notification_history 
-            if n.timestamp > datetime.now() - timedelta(days=7)
-        ]
+        self._evict_recent()
+        recent_count = len(self._recent)
         
         return {
             "total_statistics": self.statistics,
-            "recent_count": len(recent_notifications),
-            "recent_emergency_count": len([n for n in recent_notifications if n.priority == NotificationPriority.EMERGENCY]),
-            "average_daily_notifications": len(recent_notifications) / 7 if recent_notifications else 0,
+            "recent_count": recent_count,
+            "recent_emergency_count": self._recent_emergency,
+            "average_daily_notifications": recent_count / RECENT_NOTIFICATION_WINDOW.days,
             "success_rate": ((self.statistics["total_sent"] - self.statistics["failed_deliveries"]) / max(self.statistics["total_sent"], 1)) * 100,
             "last_notification": self.notification_history[-1].timestamp.isoformat() if self.notification_history else None
         }
@@ -583,15 +838,23 @@ class NotificationAgent(weave.Model):
         try:
             # Create a new config object to avoid Pydantic issues
             new_config = self.config
+            changed = False
             for key, value in config_updates.items():
                 if hasattr(new_config, key):
                     setattr(new_config, key, value)
+                    changed = True
                 else:
                     logger.warning(f"Unknown configuration key: {key}")
             
+            if changed:
+                object.__setattr__(self, '_config_dict', asdict(new_config))
+            
+            if 'quiet_hours_start' in config_updates or 'quiet_hours_end' in config_updates:
+                self._recompute_quiet_bounds()
+            
             return {
                 "status": "success",
-                "updated_config": asdict(new_config),
+                "updated_config": self._config_dict,
                 "timestamp": datetime.now().isoformat()
             }
         except Exception as e:
@@ -609,27 +872,13 @@ class NotificationAgent(weave.Model):
             history = self.notification_history
             
             if priority_filter:
-                priority_enum = NotificationPriority(priority_filter)
-                history = [n for n in history if n.priority == priority_enum]
-            
-            # Sort by timestamp (newest first) and limit
-            history = sorted(history, key=lambda x: x.timestamp, reverse=True)[:limit]
-            
-            return [
-                {
-                    "id": n.id,
-                    "timestamp": n.timestamp.isoformat(),
-                    "priority": n.priority.value,
-                    "channels": [c.value for c in n.channels],
-                    "recipient": n.recipient,
-                    "subject": n.subject,
-                    "status": n.status.value,
-                    "template_id": n.template_id,
-                    "delivered_at": n.delivered_at.isoformat() if n.delivered_at else None,
-                    "error_message": n.error_message
-                }
-                for n in history
-            ]
+                priority_enum = _PRIORITY_BY_STR[priority_filter]
+                history = (n for n in history if n.priority == priority_enum)
+            
+            # Newest first, limited; a bounded heap instead of sorting the whole history
+            history = heapq.nlargest(limit, history, key=_BY_TIMESTAMP)
+            
+            return [n.as_history_dict() for n in history]
         except Exception as e:
             logger.error(f"Error retrieving notification history: {e}")
             return []
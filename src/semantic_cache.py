@@ -0,0 +1,152 @@
+"""
+Semantic Cache for Parental Control Analysis
+
+Serves previously computed analysis and judgment results for inputs that are
+near-duplicates of earlier inputs ("youtube", "youtube " ...), so repeated
+queries skip the cloud analysis pipeline entirely.
+
+Inputs are embedded with a small local sentence-transformers model and stored
+in a sqlite-vec table partitioned by namespace, with results kept as JSON. Both
+packages are optional; when either is missing the cache reports itself
+unavailable and never hits. Embedding and queries block, so async callers should
+run get/set in an executor.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Seconds between sweeps that delete entries older than the TTL
+PURGE_INTERVAL = 300.0
+
+class SemanticCache:
+    """Embedding-keyed cache of JSON-serializable result dicts"""
+
+    def __init__(self,
+                 db_path: str = "temp/semantic_cache.db",
+                 model_name: str = DEFAULT_EMBEDDING_MODEL,
+                 threshold: float = 0.92,
+                 ttl_seconds: float = 3600.0):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.available = False
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._model = None
+        self._conn = None
+        self._purged_at = 0.0
+
+        # sqlite-vec and sentence-transformers are optional and heavy (torch), so they
+        # are imported on first construction; the cache is disabled without them
+        try:
+            import sqlite_vec
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            logger.info("Semantic cache disabled: sqlite-vec or sentence-transformers not installed")
+            return
+
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._model = SentenceTransformer(model_name)
+            dimensions = self._model.get_sentence_embedding_dimension()
+
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.enable_load_extension(True)
+            sqlite_vec.load(conn)
+            conn.enable_load_extension(False)
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS semantic_results USING vec0("
+                "namespace TEXT PARTITION KEY, "
+                f"embedding FLOAT[{dimensions}] distance_metric=cosine, "
+                "created_at FLOAT, "
+                "+payload TEXT)"
+            )
+            conn.commit()
+            self._conn = conn
+            self.available = True
+            self._purge_expired()
+        except Exception as e:
+            logger.error(f"Semantic cache initialization failed: {e}")
+
+    def _purge_expired(self):
+        """Delete entries older than the TTL (at most once per PURGE_INTERVAL)"""
+        now = time.time()
+        with self._lock:
+            if self._conn is None or now - self._purged_at < PURGE_INTERVAL:
+                return
+            self._purged_at = now
+            self._conn.execute(
+                "DELETE FROM semantic_results WHERE created_at < ?",
+                (now - self.ttl_seconds,)
+            )
+            self._conn.commit()
+
+    def _embed(self, text: str) -> bytes:
+        """Embed text as a normalized float32 vector in sqlite-vec's blob format"""
+        embedding = self._model.encode(text.strip().lower(), normalize_embeddings=True)
+        return embedding.astype("float32").tobytes()
+
+    def get(self, text: str, namespace: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result of the most similar unexpired input, if close enough"""
+        if not self.available:
+            return None
+
+        try:
+            embedding = self._embed(text)
+            with self._lock:
+                if self._conn is None:
+                    # Closed while the input was being embedded
+                    return None
+                row = self._conn.execute(
+                    "SELECT distance, payload FROM semantic_results "
+                    "WHERE embedding MATCH ? AND k = 1 AND namespace = ? AND created_at >= ?",
+                    (embedding, namespace, time.time() - self.ttl_seconds)
+                ).fetchone()
+                # Cosine distance is 1 - cosine similarity
+                if row is None or 1.0 - row[0] < self.threshold:
+                    self.misses += 1
+                    return None
+                self.hits += 1
+        except Exception as e:
+            logger.error(f"Semantic cache read error: {e}")
+            return None
+
+        return json.loads(row[1])
+
+    def set(self, text: str, namespace: str, result: Dict[str, Any]):
+        """Store a JSON-serializable result keyed by the embedding of its input"""
+        if not self.available:
+            return
+
+        try:
+            embedding = self._embed(text)
+            payload = json.dumps(result)
+            with self._lock:
+                if self._conn is None:
+                    return
+                self._conn.execute(
+                    "INSERT INTO semantic_results(namespace, embedding, created_at, payload) "
+                    "VALUES (?, ?, ?, ?)",
+                    (namespace, embedding, time.time(), payload)
+                )
+                self._conn.commit()
+            self._purge_expired()
+        except Exception as e:
+            logger.error(f"Semantic cache write error: {e}")
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self.available = False
@@ -9,7 +9,6 @@ and event history management.
 import json
 import logging
 import os
-import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, asdict
@@ -216,17 +215,50 @@ class SessionManager:
         if not self.current_session:
             raise ValueError("No active session")
         
+        event = self._build_event_record(event_data)
+        
+        with self.lock:
+            self._apply_event_locked(event, event_data)
+            
+            # Periodically save events
+            if len(self.event_cache) >= 10:
+                self._save_session_events(self.current_session.session_id)
+        
+        return event
+    
+    def record_events_batch(self, events_data: List[Dict[str, Any]]) -> List[EventRecord]:
+        """Record several monitoring events with a single lock acquisition and save"""
+        if not self.current_session:
+            raise ValueError("No active session")
+        
+        events = [self._build_event_record(event_data) for event_data in events_data]
+        
+        with self.lock:
+            for event, event_data in zip(events, events_data):
+                self._apply_event_locked(event, event_data)
+            
+            # Periodically save events
+            if events and len(self.event_cache) >= 10:
+                self._save_session_events(self.current_session.session_id)
+        
+        return events
+    
+    def _build_event_record(self, event_data: Dict[str, Any]) -> EventRecord:
+        """Create an EventRecord for the current session from event data"""
+        # Batched events carry their original timestamp
+        timestamp = event_data.get('timestamp') or datetime.now()
+        
         # Generate event ID
-        event_id = f"{self.current_session.session_id}_{int(time.time() * 1000)}"
+        event_id = f"{self.current_session.session_id}_{int(timestamp.timestamp() * 1000)}"
         
         # Create input hash for privacy
         input_hash = hashlib.md5(event_data.get('input_text', '').encode()).hexdigest()
         
         # Create event record
-        event = EventRecord(
+        return EventRecord(
             event_id=event_id,
             session_id=self.current_session.session_id,
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             event_type=event_data.get('event_type', 'unknown'),
             input_text=event_data.get('input_text', ''),
             input_hash=input_hash,
@@ -239,31 +271,26 @@ class SessionManager:
             processing_time=event_data.get('processing_time', 0.0),
             error=event_data.get('error')
         )
+    
+    def _apply_event_locked(self, event: EventRecord, event_data: Dict[str, Any]):
+        """Cache an event and update session statistics (caller holds lock)"""
+        # Add to cache
+        self.event_cache.append(event)
         
-        with self.lock:
-            # Add to cache
-            self.event_cache.append(event)
-            
-            # Update session statistics
-            self.current_session.total_events += 1
-            if event_data.get('input_text'):
-                self.current_session.total_inputs += 1
-            if event_data.get('screenshot_path'):
-                self.current_session.total_screenshots += 1
-            if event_data.get('analysis_category'):
-                self.current_session.total_analyses += 1
-            if event_data.get('judgment_action'):
-                self.current_session.total_judgments += 1
-            if event_data.get('notification_sent'):
-                self.current_session.total_notifications += 1
-            if event_data.get('error'):
-                self.current_session.errors += 1
-            
-            # Periodically save events
-            if len(self.event_cache) >= 10:
-                self._save_session_events(self.current_session.session_id)
-        
-        return event
+        # Update session statistics
+        self.current_session.total_events += 1
+        if event_data.get('input_text'):
+            self.current_session.total_inputs += 1
+        if event_data.get('screenshot_path'):
+            self.current_session.total_screenshots += 1
+        if event_data.get('analysis_category'):
+            self.current_session.total_analyses += 1
+        if event_data.get('judgment_action'):
+            self.current_session.total_judgments += 1
+        if event_data.get('notification_sent'):
+            self.current_session.total_notifications += 1
+        if event_data.get('error'):
+            self.current_session.errors += 1
     
     def get_session_events(self, session_id: str, limit: int = 100) -> List[EventRecord]:
         """Get events for a specific session"""
@@ -289,6 +316,9 @@ class SessionManager:
     
     def get_recent_events(self, limit: int = 50) -> List[EventRecord]:
         """Get recent events across all sessions"""
+        if limit <= 0:
+            return []
+        
         all_events = []
         
         # Add current session events
@@ -127,7 +127,23 @@ class TestAnalysisCache:
         # Just verify keys are generated correctly
         assert len(key1) == 32, "Key with screenshot should be valid MD5"
         assert len(key3) == 32, "Key without screenshot should be valid MD5"
-    
+
+    def test_cache_key_uses_screenshot_content(self):
+        """Test identical screenshots at different paths share a cache key"""
+        paths = []
+        for name, data in (("a.png", b"frame-1"), ("b.png", b"frame-1"), ("c.png", b"frame-2")):
+            path = os.path.join(self.temp_dir, name)
+            with open(path, 'wb') as f:
+                f.write(data)
+            paths.append(path)
+
+        key_a = self.cache._get_cache_key("test input", paths[0])
+        key_b = self.cache._get_cache_key("test input", paths[1])
+        key_c = self.cache._get_cache_key("test input", paths[2])
+
+        assert key_a == key_b, "Identical frames should share a cache key"
+        assert key_a != key_c, "Different frames should have different cache keys"
+
     def test_cache_directory_creation(self):
         """Test automatic cache directory creation"""
         # Test with non-existent directory
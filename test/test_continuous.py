@@ -121,7 +121,7 @@ async def test_continuous_monitoring():
         # Show event history
         if agent.event_history:
             print(f"\n📋 Event History:")
-            for i, event in enumerate(agent.event_history[-5:], 1):  # Last 5 events
+            for i, event in enumerate(list(agent.event_history)[-5:], 1):  # Last 5 events
                 category = event.analysis_result.category if event.analysis_result else "unknown"
                 action = event.judgment_result.action.value if event.judgment_result else "unknown"
                 print(f"   {i}. {event.input_text[:30]}... → {category} → {action} ({event.processing_time:.3f}s)")
@@ -211,6 +211,67 @@ class TestJudgmentEngine:
         assert custom_rules[0].name == 'Custom Gaming Rule'
         print("✅ Custom rule addition test passed")
     
+    @pytest.mark.asyncio
+    async def test_compiled_judge_matches_judge_content(self):
+        """Test the compiled judge reaches the same decisions as judge_content"""
+        judge = self.engine.compile_judge()
+        analysis_results = [
+            {'category': 'educational', 'confidence': 0.85, 'input_text': 'dinosaur facts', 'safety_concerns': []},
+            {'category': 'dangerous', 'confidence': 0.9, 'input_text': 'how to make a bomb', 'safety_concerns': ['violence']},
+            {'category': 'unknown', 'confidence': 0.2, 'input_text': 'asdf', 'safety_concerns': []}
+        ]
+        
+        for analysis_result in analysis_results:
+            expected = await self.engine.judge_content(analysis_result)
+            result = judge(analysis_result)
+            assert result.action == expected.action
+            assert result.applied_rules == expected.applied_rules
+            assert result.emergency_flag == expected.emergency_flag
+        
+        assert self.engine.stats['total_judgments'] == 2 * len(analysis_results)
+        print("✅ Compiled judge test passed")
+    
+    def test_compile_judge_rejects_invalid_conditions(self):
+        """Test malformed rule conditions fail at compile time"""
+        self.engine.rules.append(JudgmentRule(
+            rule_id="BAD-001",
+            name="Bad Rule",
+            description="Rule with an unsupported condition",
+            conditions={'colour': 'red'},
+            action=JudgmentAction.BLOCK
+        ))
+        
+        with pytest.raises(ValueError):
+            self.engine.compile_judge()
+        print("✅ Compile-time rule validation test passed")
+    
+    @pytest.mark.asyncio
+    async def test_compiled_judge_invalidated_by_mutators(self):
+        """Test adding rules and reconfiguring recompile the cached judge"""
+        judge = self.engine.compile_judge()
+        assert self.engine.compile_judge() is judge
+        
+        self.engine.add_custom_rule({
+            'rule_id': 'CUSTOM-BLOCK',
+            'name': 'Block Educational',
+            'description': 'Block everything educational',
+            'conditions': {'category': 'educational'},
+            'action': 'block',
+            'priority': 100
+        })
+        assert self.engine.compile_judge() is not judge
+        
+        result = await self.engine.judge_content(
+            {'category': 'educational', 'confidence': 0.9, 'input_text': 'math', 'safety_concerns': []}
+        )
+        assert result.action == JudgmentAction.BLOCK
+        assert result.applied_rules[0] == 'CUSTOM-BLOCK'
+        
+        judge = self.engine.compile_judge()
+        self.engine.configure_judgment_settings(strictness_level='strict')
+        assert self.engine.compile_judge() is not judge
+        print("✅ Compiled judge invalidation test passed")
+    
     def test_judgment_statistics(self):
         """Test judgment statistics collection"""
         stats = self.engine.get_judgment_statistics()
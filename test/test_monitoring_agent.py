@@ -97,10 +97,10 @@ class TestMonitoringAgent:
         assert self.agent.config.strictness_level == "strict"
         assert self.agent.config.enable_notifications == False
     
-    @patch('src.monitoring_agent.start_keylogger_tool')
+    @patch('monitoring_agent.start_keylogger')
     async def test_start_monitoring(self, mock_keylogger):
         """Test starting monitoring system"""
-        mock_keylogger.return_value = {"success": True, "message": "Keylogger started"}
+        mock_keylogger.return_value = {"status": "success", "message": "Keylogger started"}
         
         result = await self.agent.start_monitoring("test_session_001")
         
@@ -114,13 +114,13 @@ class TestMonitoringAgent:
         assert session is not None
         assert session.status == "active"
     
-    @patch('src.monitoring_agent.start_keylogger_tool')
-    @patch('src.monitoring_agent.stop_keylogger_tool')
-    @patch('src.monitoring_agent.cleanup_temp_files_tool')
+    @patch('monitoring_agent.start_keylogger')
+    @patch('monitoring_agent.stop_keylogger')
+    @patch('monitoring_agent.cleanup_temp_files_tool')
     async def test_stop_monitoring(self, mock_cleanup, mock_stop, mock_start):
         """Test stopping monitoring system"""
-        mock_start.return_value = {"success": True, "message": "Keylogger started"}
-        mock_stop.return_value = {"success": True, "message": "Keylogger stopped"}
+        mock_start.return_value = {"status": "success", "message": "Keylogger started"}
+        mock_stop.return_value = {"status": "success", "message": "Keylogger stopped"}
         mock_cleanup.return_value = {"success": True, "message": "Files cleaned"}
         
         # Start monitoring first
@@ -138,10 +138,10 @@ class TestMonitoringAgent:
         assert session.status == "completed"
         assert session.end_time is not None
     
-    @patch('src.monitoring_agent.start_keylogger_tool')
+    @patch('monitoring_agent.start_keylogger')
     async def test_start_monitoring_keylogger_failure(self, mock_keylogger):
         """Test handling keylogger startup failure"""
-        mock_keylogger.return_value = {"success": False, "error": "Permission denied"}
+        mock_keylogger.return_value = {"status": "error", "error": "Permission denied"}
         
         result = await self.agent.start_monitoring("test_session_003")
         
@@ -159,10 +159,10 @@ class TestMonitoringAgent:
         assert "config" in status
         assert "timestamp" in status
     
-    @patch('src.monitoring_agent.start_keylogger_tool')
+    @patch('monitoring_agent.start_keylogger')
     async def test_manual_input_processing(self, mock_keylogger):
         """Test manual input processing"""
-        mock_keylogger.return_value = {"success": True, "message": "Keylogger started"}
+        mock_keylogger.return_value = {"status": "success", "message": "Keylogger started"}
         
         # Start monitoring
         await self.agent.start_monitoring("test_session_004")
@@ -194,7 +194,70 @@ class TestMonitoringAgent:
         # Should handle gracefully even without active session
         assert result["status"] in ["success", "error"]
         assert result["input_text"] == "Test input"
-    
+
+    async def test_manual_input_rejects_empty_and_oversized(self):
+        """Test empty and oversized manual inputs are rejected without analysis"""
+        async def fail_analysis(*args, **kwargs):
+            raise AssertionError("analysis should not run")
+
+        original_analyze = self.agent.analysis_agent.analyze_input_context
+        object.__setattr__(self.agent.analysis_agent, 'analyze_input_context', fail_analysis)
+        try:
+            empty = await self.agent.process_manual_input("", None)
+            oversized = await self.agent.process_manual_input(
+                "A" * (self.agent.config.max_input_length + 1), None
+            )
+        finally:
+            object.__setattr__(self.agent.analysis_agent, 'analyze_input_context', original_analyze)
+
+        assert empty["status"] == "error"
+        assert empty["error"] == "empty_input"
+        assert oversized["status"] == "error"
+        assert oversized["error"] == "input_too_long"
+
+    async def test_manual_input_cache_hit(self):
+        """Test repeated manual input is served from the prompt cache"""
+        from judgment_engine import JudgmentAction
+        
+        analysis_result = Mock(category="educational", confidence=0.9, safety_concerns=[],
+                               educational_value="math", context_summary="Math question")
+        judgment_result = Mock(action=JudgmentAction.ALLOW, confidence=0.9, reasoning="Safe")
+        object.__setattr__(self.agent.analysis_agent, 'analyze_input_context',
+                           AsyncMock(return_value=analysis_result))
+        object.__setattr__(self.agent, '_compiled_judge', Mock(return_value=judgment_result))
+        
+        first = await self.agent.process_manual_input("What is 2+2?", None)
+        second = await self.agent.process_manual_input("  what is 2+2? ", None)
+        
+        assert first["status"] == "success"
+        assert second["judgment"] == first["judgment"]
+        assert self.agent.analysis_agent.analyze_input_context.await_count == 1
+        assert self.agent.get_monitoring_status()["statistics"]["cache_hits"] == 1
+        
+        # Changing the age group invalidates cached results
+        self.agent.configure_monitoring(age_group="high_school")
+        await self.agent.process_manual_input("What is 2+2?", None)
+        assert self.agent.analysis_agent.analyze_input_context.await_count == 2
+
+    async def test_manual_input_notification_sent_inline_without_monitoring(self):
+        """Test notifications are delivered before returning when monitoring is not running"""
+        from judgment_engine import JudgmentAction
+
+        analysis_result = Mock(category="dangerous", confidence=0.9, safety_concerns=["weapons"],
+                               educational_value="none", context_summary="Dangerous request")
+        judgment_result = Mock(action=JudgmentAction.BLOCK, confidence=0.9, reasoning="Unsafe")
+        object.__setattr__(self.agent.analysis_agent, 'analyze_input_context',
+                           AsyncMock(return_value=analysis_result))
+        object.__setattr__(self.agent, '_compiled_judge', Mock(return_value=judgment_result))
+        send_notification = AsyncMock()
+        object.__setattr__(self.agent, '_send_appropriate_notification', send_notification)
+
+        result = await self.agent.process_manual_input("How to make a bomb", None)
+
+        assert result["notification"] == {"status": "sent", "action": "block"}
+        send_notification.assert_awaited_once_with(analysis_result, judgment_result)
+        assert self.agent._notif_task is None
+
     def test_recent_events_retrieval(self):
         """Test recent events retrieval"""
         # Add some test events to history
@@ -303,11 +366,11 @@ class TestMonitoringAgentIntegration:
             print(f"  Action: {judgment['action']}")
             print(f"  Processing time: {result['processing_time']:.3f}s")
     
-    @patch('src.monitoring_agent.start_keylogger_tool')
-    @patch('src.monitoring_agent.get_current_input_tool')
+    @patch('monitoring_agent.start_keylogger')
+    @patch('monitoring_agent.get_current_input')
     async def test_monitoring_loop_simulation(self, mock_get_input, mock_start):
         """Test monitoring loop simulation"""
-        mock_start.return_value = {"success": True, "message": "Keylogger started"}
+        mock_start.return_value = {"status": "success", "message": "Keylogger started"}
         
         # Simulate input completion sequence
         input_sequence = [
@@ -464,13 +527,13 @@ class TestMonitoringAgentErrorHandling:
     
     async def test_judgment_error_handling(self):
         """Test handling of judgment errors"""
-        # Mock judgment engine to raise an error
-        original_judge = self.agent.judgment_engine.judge_content
+        # Mock the compiled judge to raise an error
+        original_judge = self.agent._compiled_judge
         
-        async def mock_judge_error(*args, **kwargs):
+        def mock_judge_error(*args, **kwargs):
             raise Exception("Judgment failed")
         
-        self.agent.judgment_engine.judge_content = mock_judge_error
+        object.__setattr__(self.agent, '_compiled_judge', mock_judge_error)
         
         result = await self.agent.process_manual_input("Test input", None)
         
@@ -478,8 +541,8 @@ class TestMonitoringAgentErrorHandling:
         assert result["status"] == "error"
         assert "Judgment failed" in result["error"]
         
-        # Restore original method
-        self.agent.judgment_engine.judge_content = original_judge
+        # Restore original judge
+        object.__setattr__(self.agent, '_compiled_judge', original_judge)
     
     async def test_notification_error_handling(self):
         """Test handling of notification errors"""
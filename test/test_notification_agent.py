@@ -112,11 +112,16 @@ class TestNotificationAgent:
             mock_datetime.now.return_value.time.return_value = datetime.strptime("10:30", "%H:%M").time()
             mock_datetime.strptime = datetime.strptime
             assert agent._is_quiet_hours() == False
+        
+        # Quiet hours end at 07:00:00, not at the end of that minute
+        with patch('notification_agent.datetime') as mock_datetime:
+            mock_datetime.now.return_value.time.return_value = datetime.strptime("07:00:59", "%H:%M:%S").time()
+            assert agent._is_quiet_hours() == False
     
     @pytest.mark.asyncio
     async def test_desktop_notification_macos(self, agent):
         """Test desktop notification on macOS"""
-        with patch('notification_agent.platform.system', return_value='Darwin'):
+        with patch('notification_agent._SYSTEM', 'Darwin'):
             with patch('notification_agent.subprocess.run') as mock_run:
                 mock_run.return_value = None
                 
@@ -126,10 +131,21 @@ class TestNotificationAgent:
                 assert result["channel"] == "desktop"
                 assert mock_run.called
     
+    @pytest.mark.asyncio
+    async def test_desktop_notification_escapes_applescript(self, agent):
+        """Test quotes and backslashes are escaped in the AppleScript literal"""
+        with patch('notification_agent._SYSTEM', 'Darwin'):
+            with patch('notification_agent.subprocess.run') as mock_run:
+                await agent._send_desktop_notification('Say "hi"', 'C:\\path', NotificationPriority.MEDIUM)
+                
+                script = mock_run.call_args[0][0][2]
+                assert 'C:\\\\path' in script
+                assert 'Say \\"hi\\"' in script
+    
     @pytest.mark.asyncio
     async def test_desktop_notification_failure(self, agent):
         """Test desktop notification failure"""
-        with patch('notification_agent.platform.system', return_value='Darwin'):
+        with patch('notification_agent._SYSTEM', 'Darwin'):
             with patch('notification_agent.subprocess.run', side_effect=Exception("Command failed")):
                 
                 result = await agent._send_desktop_notification("Test Subject", "Test Body", NotificationPriority.MEDIUM)
@@ -146,19 +162,60 @@ class TestNotificationAgent:
             'EMAIL_USER': 'test@example.com',
             'EMAIL_PASSWORD': 'password'
         }):
-            with patch('notification_agent.smtplib.SMTP') as mock_smtp:
-                mock_server = Mock()
+            with patch('notification_agent.aiosmtplib.SMTP') as mock_smtp:
+                mock_server = AsyncMock()
+                mock_server.is_connected = True
                 mock_smtp.return_value = mock_server
                 
                 result = await agent._send_email_notification("Test Subject", "Test Body", NotificationPriority.HIGH)
                 
                 assert result["success"] == True
                 assert result["channel"] == "email"
+                assert mock_server.connect.called
                 assert mock_server.starttls.called
                 assert mock_server.login.called
                 assert mock_server.send_message.called
-                assert mock_server.quit.called
     
+    @pytest.mark.asyncio
+    async def test_email_notification_reuses_connection(self, agent):
+        """Test consecutive emails share one authenticated SMTP connection"""
+        with patch.dict(os.environ, {
+            'SMTP_SERVER': 'smtp.test.com',
+            'SMTP_PORT': '587',
+            'EMAIL_USER': 'test@example.com',
+            'EMAIL_PASSWORD': 'password'
+        }):
+            with patch('notification_agent.aiosmtplib.SMTP') as mock_smtp:
+                mock_server = AsyncMock()
+                mock_server.is_connected = True
+                mock_smtp.return_value = mock_server
+                
+                await agent._send_email_notification("First", "Body", NotificationPriority.HIGH)
+                await agent._send_email_notification("Second", "Body", NotificationPriority.HIGH)
+                
+                assert mock_smtp.call_count == 1
+                assert mock_server.login.call_count == 1
+                assert mock_server.send_message.call_count == 2
+
+    def test_email_connection_per_event_loop(self, agent):
+        """Test emails sent from different event loops do not share a connection"""
+        with patch.dict(os.environ, {
+            'SMTP_SERVER': 'smtp.test.com',
+            'SMTP_PORT': '587',
+            'EMAIL_USER': 'test@example.com',
+            'EMAIL_PASSWORD': 'password'
+        }):
+            with patch('notification_agent.aiosmtplib.SMTP') as mock_smtp:
+                mock_server = AsyncMock()
+                mock_server.is_connected = True
+                mock_smtp.return_value = mock_server
+
+                first = asyncio.run(agent._send_email_notification("First", "Body", NotificationPriority.HIGH))
+                second = asyncio.run(agent._send_email_notification("Second", "Body", NotificationPriority.HIGH))
+
+                assert first["success"] and second["success"]
+                assert mock_smtp.call_count == 2
+
     @pytest.mark.asyncio
     async def test_email_notification_no_config(self, agent):
         """Test email notification without configuration"""
@@ -208,7 +265,7 @@ class TestNotificationAgent:
     @pytest.mark.asyncio
     async def test_child_notification_macos(self, agent):
         """Test child notification on macOS"""
-        with patch('notification_agent.platform.system', return_value='Darwin'):
+        with patch('notification_agent._SYSTEM', 'Darwin'):
             with patch('notification_agent.subprocess.run') as mock_run:
                 mock_run.return_value = None
                 
@@ -239,6 +296,18 @@ class TestNotificationAgent:
                 assert len(agent.notification_history) == 1
                 assert agent.statistics["total_sent"] == 1
     
+    @pytest.mark.asyncio
+    async def test_send_notification_ids_unique_in_burst(self, agent):
+        """Test notifications sent back to back get distinct IDs"""
+        variables = {"child_name": "TestChild", "content_summary": "Test", "category": "test", "reason": "test", "timestamp": "2024-01-01 12:00:00"}
+        
+        with patch.object(agent, '_is_quiet_hours', return_value=False):
+            with patch.object(agent, '_send_desktop_notification', return_value={"success": True, "channel": "desktop"}):
+                with patch.object(agent, '_send_email_notification', return_value={"success": True, "channel": "email"}):
+                    results = [await agent.send_notification("content_blocked", variables) for _ in range(3)]
+        
+        assert len({r["notification_id"] for r in results}) == 3
+    
     @pytest.mark.asyncio
     async def test_send_notification_during_quiet_hours(self, agent):
         """Test notification sending during quiet hours"""
@@ -290,12 +359,15 @@ class TestNotificationAgent:
     @pytest.mark.asyncio
     async def test_send_emergency_notification(self, agent):
         """Test emergency notification sending"""
-        with patch.object(agent, 'send_notification', return_value={"status": "success", "notification_id": "test123"}):
+        with patch.object(agent, '_dispatch', return_value={"success": True}) as mock_dispatch:
             
             result = await agent.send_emergency_notification("Dangerous content detected", "critical")
             
             assert result["status"] == "success"
             assert agent.statistics["emergency_count"] == 1
+            # Desktop, email and (configured) SMS
+            assert mock_dispatch.call_count == 3
+            assert agent.notification_history[-1].template_id == "emergency_alert"
     
     def test_statistics_tracking(self, agent):
         """Test statistics tracking"""
@@ -320,6 +392,26 @@ class TestNotificationAgent:
         assert agent.statistics["by_channel"]["email"] == 1
         assert agent.statistics["by_status"]["sent"] == 1
     
+    def test_recent_statistics_window(self, agent):
+        """Test recent counters drop notifications older than the window"""
+        from notification_agent import NotificationRecord
+        for days_ago, priority in ((10, NotificationPriority.EMERGENCY), (1, NotificationPriority.EMERGENCY), (0, NotificationPriority.LOW)):
+            agent._track_recent(NotificationRecord(
+                id=f"test{days_ago}",
+                timestamp=datetime.now() - timedelta(days=days_ago),
+                priority=priority,
+                channels=[NotificationChannel.DESKTOP],
+                recipient="parent",
+                subject="Test",
+                body="Test body",
+                status=NotificationStatus.SENT
+            ))
+        
+        stats = agent.get_notification_statistics()
+        
+        assert stats["recent_count"] == 2
+        assert stats["recent_emergency_count"] == 1
+    
     def test_get_notification_statistics(self, agent):
         """Test getting notification statistics"""
         # Add some mock history
@@ -346,6 +438,17 @@ class TestNotificationAgent:
         assert agent.config.desktop_notifications == False
         assert agent.config.parent_email == "new@example.com"
     
+    def test_configure_quiet_hours(self, agent):
+        """Test quiet hours changes take effect immediately"""
+        agent.configure_notifications(quiet_hours_start="09:00", quiet_hours_end="11:00")
+        
+        with patch('notification_agent.datetime') as mock_datetime:
+            mock_datetime.now.return_value.time.return_value = datetime.strptime("10:30", "%H:%M").time()
+            assert agent._is_quiet_hours() == True
+        
+        agent.configure_notifications(quiet_hours_start="invalid")
+        assert agent._is_quiet_hours() == False
+    
     def test_get_notification_history(self, agent):
         """Test getting notification history"""
         # Add some mock history